@@ -1,11 +1,11 @@
 import re
 import sys
 
+# Template for string "## Version X.YY.ZZ"
+_VERSION_RE = re.compile(r"(##\s*Version\s+)(\d+)\.(\d+)\.(\d+)")
 
-def increment_version(file_path):
-    # Template for string "## Version X.YY.ZZ"
-    version_pattern = r"(##\s*Version\s+)(\d+)\.(\d+)\.(\d+)"
 
+def increment_version(file_path):
     with open(file_path, "r", encoding="utf-8") as file:
         content = file.read()
 
@@ -24,12 +24,18 @@ def increment_version(file_path):
 
         return f"{match.group(1)}{major}.{minor}.{sub}"
 
-    updated_content, count = re.subn(version_pattern, increase_version, content)
+    # Only the first "## Version" heading is bumped; splice it in place
+    # instead of scanning the rest of the file.
+    match = _VERSION_RE.search(content)
 
-    if count == 0:
+    if match is None:
         print("Version string not found!")
         sys.exit(1)
 
+    updated_content = (
+        content[: match.start()] + increase_version(match) + content[match.end() :]
+    )
+
     with open(file_path, "w", encoding="utf-8") as file:
         file.write(updated_content)
 
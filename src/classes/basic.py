@@ -1,11 +1,46 @@
+import bisect
 import copy
-from typing import Any, List, Tuple, Type
+import io
+import itertools
+import operator
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type
 from ..classes.element_types import ElementsTypes
 from ..utils.counters import Counters
 from ..logger.logger import Logger, LoggerManager
 from ..utils.string_formater import StringFormater
 from ..utils.unsorted import UnsortedUnils
 
+# Shared helpers, created once for Basic and BasicArray alike. Counters is a
+# singleton and the two utility classes are stateless namespaces.
+_COUNTERS = Counters()
+_UTILS = UnsortedUnils()
+_STRING_FORMATER = StringFormater()
+
+# Bound once at import: every element construction reads the sequence counter.
+_SEQUENCE_COUNTER = _COUNTERS.types.SEQUENCE_COUNTER
+_get_counter = _COUNTERS.get
+
+
+def _makeIncludeTypeFilter(element_type: ElementsTypes):
+    def includeTypeFilter(elements: List["Basic"]) -> List["Basic"]:
+        return [element for element in elements if element.element_type is element_type]
+
+    return includeTypeFilter
+
+
+# One ready-made filter per element type for `BasicArray.getElementsIE(include=...)`.
+_INCLUDE_TYPE_FILTERS: Dict[ElementsTypes, Callable[[List["Basic"]], List["Basic"]]] = {
+    member: _makeIncludeTypeFilter(member) for member in ElementsTypes
+}
+
+_INTERVAL_END = operator.itemgetter(1)
+
+# Avoids the enum `.name` descriptor lookup in `Basic.__repr__`.
+_ELEMENT_TYPE_NAMES: Dict[ElementsTypes, str] = {
+    member: member.name for member in ElementsTypes
+}
+
 
 class Basic:
     """
@@ -17,9 +52,36 @@ class Basic:
     # Class-level attributes for shared utilities.
     # These are assumed to be singletons or stateless helpers
     # that all instances of Basic (and its subclasses) can share.
-    counters = Counters()
-    utils = UnsortedUnils()
-    string_formater = StringFormater()
+    counters = _COUNTERS
+    utils = _UTILS
+    string_formater = _STRING_FORMATER
+
+    # Fixed attribute layout for the base fields. Subclasses that do not
+    # declare their own __slots__ still get a __dict__ for their extra state.
+    __slots__ = (
+        "identifier",
+        "sequence",
+        "_source_interval",
+        "element_type",
+        "_number",
+        "logger",
+        "_name_cache",
+    )
+
+    # Template for `__repr__`; subclasses can override just the template.
+    _REPR_FMT: str = (
+        "Basic(identifier={identifier!r}, sequence={sequence!r}, "
+        "source_interval={source_interval!r}, element_type={element_type_name!r}, "
+        "number={number!r})"
+    )
+
+    # Incremented every time an element is renamed after construction.
+    # BasicArray compares it against the value its identifier index was built
+    # with to know when that index may be stale.
+    _rename_generation: int = 0
+    # Same idea for `source_interval`, checked by BasicArray's interval index;
+    # incremented by every assignment after construction.
+    _interval_generation: int = 0
 
     def __init__(
         self,
@@ -36,15 +98,22 @@ class Basic:
                                                positions of the element in the source code.
             element_type (ElementsTypes): The type of the element, defaulting to NONE_ELEMENT.
         """
-        self.identifier: str = identifier
+        # Interned so that identifier comparisons and dict lookups can succeed
+        # on the identity check alone.
+        self.identifier: str = (
+            sys.intern(identifier) if type(identifier) is str else identifier
+        )
         # Assigns a unique sequence number from the global counter.
         # Changed from a tuple to an int, assuming sequence is always a single number.
-        self.sequence: int = self.counters.get(self.counters.types.SEQUENCE_COUNTER)
-        self.source_interval: Tuple[int, int] = source_interval
+        self.sequence: int = _get_counter(_SEQUENCE_COUNTER)
+        # Set through the slot: a new element is not in any array yet, so the
+        # interval indexes do not need to be invalidated.
+        self._source_interval: Tuple[int, int] = source_interval
         self.element_type: ElementsTypes = element_type
-        self.number: int | None = (
+        self._number: int | None = (
             None  # Optional numerical suffix, e.g., for unique naming in context.
         )
+        self._name_cache: str | None = None  # Last result of `getName`.
         self.logger: Logger = LoggerManager().getLogger(self.__class__.__qualname__)
 
     def copy(self) -> "Basic":
@@ -85,6 +154,54 @@ class Basic:
         )
         return new_basic
 
+    def changeIdentifier(self, new_identifier: str):
+        """
+        Renames the element. Use this instead of assigning `identifier`
+        directly on an element that is already stored in a BasicArray, so the
+        array's identifier index is refreshed.
+
+        Args:
+            new_identifier (str): The new identifier.
+        """
+        self.identifier = (
+            sys.intern(new_identifier)
+            if type(new_identifier) is str
+            else new_identifier
+        )
+        self._name_cache = None
+        Basic._rename_generation += 1
+
+    def changeSourceInterval(self, source_interval: Tuple[int, int]):
+        """
+        Moves the element to another source interval and marks the interval
+        indexes of every BasicArray as stale. Assigning `source_interval`
+        goes through this method as well.
+
+        Args:
+            source_interval (Tuple[int, int]): The new start and end positions.
+        """
+        self._source_interval = source_interval
+        Basic._interval_generation += 1
+
+    @property
+    def source_interval(self) -> Tuple[int, int]:
+        """Start and end positions of the element in the source code."""
+        return self._source_interval
+
+    @source_interval.setter
+    def source_interval(self, source_interval: Tuple[int, int]):
+        self.changeSourceInterval(source_interval)
+
+    @property
+    def number(self) -> int | None:
+        """Optional numerical suffix, e.g., for unique naming in context."""
+        return self._number
+
+    @number.setter
+    def number(self, value: int | None):
+        self._number = value
+        self._name_cache = None
+
     def getName(self) -> str:
         """
         Returns the name of the element.
@@ -93,12 +210,17 @@ class Basic:
         Returns:
             str: The element's name.
         """
-        # Uses an f-string for concise and readable string formatting.
-        return (
-            self.identifier
-            if self.number is None
-            else f"{self.identifier}_{self.number}"
-        )
+        # The name only changes through `changeIdentifier` or the `number`
+        # setter, both of which reset the cache.
+        name = self._name_cache
+        if name is None:
+            name = (
+                self.identifier
+                if self._number is None
+                else f"{self.identifier}_{self._number}"
+            )
+            self._name_cache = name
+        return name
 
     def __repr__(self) -> str:
         """
@@ -108,13 +230,14 @@ class Basic:
         Returns:
             str: A formatted string representation of the object.
         """
-        # Uses f-strings for clear representation. `!r` ensures the value's repr is used.
-        # `.name` is used for `ElementsTypes` enum to show its string name.
-        # The leading tab `\t` has been removed for cleaner output.
-        return (
-            f"Basic(identifier={self.identifier!r}, sequence={self.sequence!r}, "
-            f"source_interval={self.source_interval!r}, element_type={self.element_type.name!r}, "
-            f"number={self.number!r})"
+        return self._REPR_FMT.format_map(
+            {
+                "identifier": self.identifier,
+                "sequence": self.sequence,
+                "source_interval": self.source_interval,
+                "element_type_name": _ELEMENT_TYPE_NAMES[self.element_type],
+                "number": self._number,
+            }
         )
 
 
@@ -123,13 +246,16 @@ class BasicArray:
     A dynamic array class designed to hold objects of type 'Basic' or its subclasses.
     Provides methods for common array operations like adding, removing, accessing,
     and filtering elements.
+
+    Lookups by identifier go through a lazily built identifier -> index dict.
+    Appending to `elements` directly is fine; any other structural change
+    should go through the array's methods (or `_invalidateIdentifierIndex`).
     """
 
-    # Class-level instances for utility functions and logging.
-    # These are initialized once and shared across all BasicArray instances.
-    counters = Counters()
-    utils = UnsortedUnils()
-    string_formater = StringFormater()
+    # Class-level instances for utility functions, shared with Basic.
+    counters = _COUNTERS
+    utils = _UTILS
+    string_formater = _STRING_FORMATER
 
     def __init__(self, element_type: Type[Basic] = Basic):
         """
@@ -142,6 +268,96 @@ class BasicArray:
         self.elements = []
         self.element_type: Type[Basic] = element_type
         self.logger: Logger = LoggerManager().getLogger(self.__class__.__qualname__)
+        # Identifier -> index of its first occurrence, see `_findIdentifierIndex`.
+        self._identifier_index: Dict[str, int] | None = None
+        self._indexed_elements: List[Basic] | None = None
+        self._indexed_len: int = 0
+        self._indexed_last: Basic | None = None
+        self._indexed_generation: int = -1
+        # Sorted (start, end) pairs of the element intervals and the running
+        # maximum of their ends, see `checkSourceInteval`.
+        self._intervals_sorted: List[Tuple[int, int]] | None = None
+        self._intervals_max_end: List[int] = []
+        self._intervals_elements: List[Basic] | None = None
+        self._intervals_len: int = 0
+        self._intervals_last: Basic | None = None
+        self._intervals_generation: int = -1
+
+    def _invalidateIdentifierIndex(self):
+        """
+        Drops the identifier index; it is rebuilt on the next lookup.
+        """
+        self._identifier_index = None
+        self._intervals_sorted = None
+
+    def _buildIdentifierIndex(self) -> Dict[str, int]:
+        """
+        Rebuilds the identifier index from scratch.
+
+        Returns:
+            Dict[str, int]: The new index.
+        """
+        index: Dict[str, int] = {}
+        for position, element in enumerate(self.elements):
+            index.setdefault(element.identifier, position)
+        self._identifier_index = index
+        self._indexed_elements = self.elements
+        self._indexed_len = len(self.elements)
+        self._indexed_last = self.elements[-1] if self.elements else None
+        self._indexed_generation = Basic._rename_generation
+        return index
+
+    def _findIdentifierIndex(self, identifier: str) -> int | None:
+        """
+        Returns the index of the first element with the given identifier.
+
+        The index is rebuilt when the list object was replaced, when it
+        shrank, when the last indexed element is no longer at its position
+        (e.g. `pop()` followed by `append()`) or when an element was renamed;
+        elements appended since the last lookup are indexed incrementally. A
+        hit is always checked against the list, so reorders done in place
+        (e.g. `sort`) are picked up as well, and a miss falls back to a linear
+        scan, which finds elements renamed by assigning `identifier` or put
+        into the middle of the list with `elements[i] = ...`.
+
+        Args:
+            identifier (str): The identifier to look up.
+
+        Returns:
+            int | None: The index, or None if no element has this identifier.
+        """
+        elements = self.elements
+        index = self._identifier_index
+        if (
+            index is None
+            or self._indexed_elements is not elements
+            or self._indexed_generation != Basic._rename_generation
+            or self._indexed_len > len(elements)
+            or (
+                self._indexed_len > 0
+                and elements[self._indexed_len - 1] is not self._indexed_last
+            )
+        ):
+            index = self._buildIdentifierIndex()
+        elif self._indexed_len < len(elements):
+            for position in range(self._indexed_len, len(elements)):
+                index.setdefault(elements[position].identifier, position)
+            self._indexed_len = len(elements)
+            self._indexed_last = elements[-1]
+
+        position = index.get(identifier)
+        if position is not None:
+            if elements[position].identifier == identifier:
+                return position
+            return self._buildIdentifierIndex().get(identifier)
+
+        # A miss is confirmed by a scan: `identifier` may have been assigned
+        # directly or an element replaced in the middle of the list.
+        for position, element in enumerate(elements):
+            if element.identifier == identifier:
+                self._buildIdentifierIndex()
+                return position
+        return None
 
     def __len__(self) -> int:
         """
@@ -150,6 +366,28 @@ class BasicArray:
         """
         return len(self.elements)
 
+    def __bool__(self) -> bool:
+        """
+        Returns True if the array holds at least one element.
+        """
+        return bool(self.elements)
+
+    def __contains__(self, item: "str | Basic") -> bool:
+        """
+        Supports `identifier in array` (through the identifier index) as well
+        as `element in array`.
+
+        Args:
+            item (str | Basic): An identifier or an element.
+
+        Returns:
+            bool: True if an element with this identifier, or an element equal
+                  to `item`, is in the array.
+        """
+        if isinstance(item, str):
+            return self._findIdentifierIndex(item) is not None
+        return item in self.elements
+
     def __iter__(self):
         """
         Returns an iterator over the elements in the array.
@@ -182,12 +420,40 @@ class BasicArray:
         """
         if not isinstance(new_element, self.element_type):
             self.logger.warning(
-                f"Object should be of type {self.element_type.__name__} but received "
-                f"an object of type {type(new_element).__name__}. Object: {new_element}"
+                "Object should be of type %s but received an object of type %s. "
+                "Object: %s",
+                self.element_type.__name__,
+                type(new_element).__name__,
+                new_element,
             )
         self.elements.append(new_element)
         return len(self.elements) - 1
 
+    def extend(self, new_elements: Iterable[Basic], checked: bool = True):
+        """
+        Appends several elements at once. Unlike calling `addElement` in a
+        loop, subclass-specific `addElement` logic is not applied.
+
+        Args:
+            new_elements (Iterable[Basic]): The elements to append.
+            checked (bool): Whether to type-check the appended elements. Pass
+                            False when they come from an array of the same
+                            element type.
+        """
+        start = len(self.elements)
+        self.elements.extend(new_elements)
+        if checked:
+            element_type = self.element_type
+            for element in self.elements[start:]:
+                if not isinstance(element, element_type):
+                    self.logger.warning(
+                        "Object should be of type %s but received an object of type %s. "
+                        "Object: %s",
+                        element_type.__name__,
+                        type(element).__name__,
+                        element,
+                    )
+
     def checkSourceInteval(self, source_interval: Tuple[int, int]) -> bool:
         """
         Checks if the given `source_interval` is contained within the `source_interval`
@@ -200,12 +466,75 @@ class BasicArray:
             bool: False if the `source_interval` is contained within any element's
                   source interval, True otherwise.
         """
-        for element in self.elements:
-            if self.utils.is_interval_contained(
-                source_interval, element.source_interval
-            ):
-                return False
-        return True
+        intervals = self._getSortedIntervals()
+        query_start, query_end = source_interval
+        # Only intervals starting at or before the query can contain it, and
+        # one of them does iff the largest of their ends reaches the query end.
+        position = bisect.bisect_right(intervals, (query_start, float("inf")))
+        return position == 0 or self._intervals_max_end[position - 1] < query_end
+
+    def _getSortedIntervals(self) -> List[Tuple[int, int]]:
+        """
+        Returns the element intervals sorted by start position and keeps
+        `_intervals_max_end[i]` equal to the largest end among the first
+        `i + 1` of them.
+
+        Built lazily and kept up to date the same way as the identifier index:
+        rebuilt when the list object was replaced, shrank, when the last
+        indexed element is no longer at its position (e.g. `pop()` followed by
+        `append()`) or when any element's `source_interval` was assigned;
+        appended elements are inserted incrementally.
+
+        Returns:
+            List[Tuple[int, int]]: The sorted (start, end) pairs.
+        """
+        elements = self.elements
+        intervals = self._intervals_sorted
+        if (
+            intervals is None
+            or self._intervals_elements is not elements
+            or self._intervals_generation != Basic._interval_generation
+            or self._intervals_len > len(elements)
+            or (
+                self._intervals_len > 0
+                and elements[self._intervals_len - 1] is not self._intervals_last
+            )
+        ):
+            intervals = sorted(tuple(element.source_interval) for element in elements)
+            self._intervals_sorted = intervals
+            self._intervals_elements = elements
+            self._intervals_generation = Basic._interval_generation
+            self._intervals_max_end = list(
+                itertools.accumulate(map(_INTERVAL_END, intervals), max)
+            )
+        elif self._intervals_len < len(elements):
+            first_changed = len(intervals)
+            for position in range(self._intervals_len, len(elements)):
+                interval = tuple(elements[position].source_interval)
+                insert_at = bisect.bisect_right(intervals, interval)
+                intervals.insert(insert_at, interval)
+                first_changed = min(first_changed, insert_at)
+            self._updateMaxEnds(first_changed)
+        self._intervals_len = len(elements)
+        self._intervals_last = elements[-1] if elements else None
+        return intervals
+
+    def _updateMaxEnds(self, start: int):
+        """
+        Recomputes `_intervals_max_end` from position `start` onwards. Elements
+        are usually added in source order, so this is mostly a short tail.
+        """
+        intervals = self._intervals_sorted
+        max_ends = self._intervals_max_end
+        del max_ends[start:]
+        if start < len(intervals):
+            tail_ends = map(_INTERVAL_END, itertools.islice(intervals, start, None))
+            if start:
+                running = itertools.accumulate(tail_ends, max, initial=max_ends[-1])
+                next(running)  # skip the initial value, it is already stored
+            else:
+                running = itertools.accumulate(tail_ends, max)
+            max_ends.extend(running)
 
     def copy(self) -> "BasicArray":
         """
@@ -216,8 +545,11 @@ class BasicArray:
             BasicArray: A new BasicArray instance containing copies of the original elements.
         """
         new_array = BasicArray(self.element_type)
-        for element in self.elements:
-            new_array.addElement(element.copy())  # Calls the element's copy method
+        # Copies keep their identifiers and positions, so the elements can be
+        # assigned in bulk (their types were already checked when added here)
+        # and a current identifier index can be reused as is.
+        new_array.elements = [element.copy() for element in self.elements]
+        self._shareIdentifierIndex(new_array)
         return new_array
 
     def __deepcopy__(self, memo: dict[int, Any]) -> "BasicArray":
@@ -235,10 +567,43 @@ class BasicArray:
         """
         new_array = BasicArray(self.element_type)
         memo[id(self)] = new_array  # Register the new array in the memo
+        new_elements = []
         for element in self.elements:
-            new_array.addElement(copy.deepcopy(element, memo))
+            new_element = memo.get(id(element))
+            if new_element is None:
+                if type(element) is Basic:
+                    # Plain Basic holds only immutable values: its copy() is
+                    # already a deep copy, so skip the deepcopy dispatch.
+                    new_element = element.copy()
+                    memo[id(element)] = new_element
+                else:
+                    new_element = copy.deepcopy(element, memo)
+            new_elements.append(new_element)
+        new_array.elements = new_elements
+        self._shareIdentifierIndex(new_array)
         return new_array
 
+    def _shareIdentifierIndex(self, new_array: "BasicArray"):
+        """
+        Gives a copy of this array's identifier index to `new_array` if the
+        index is up to date. Only valid when `new_array.elements` holds
+        `self.elements` (or copies of them) in the same order.
+        """
+        if (
+            self._identifier_index is not None
+            and self._indexed_elements is self.elements
+            and self._indexed_len == len(self.elements)
+            and (self.elements[-1] if self.elements else None) is self._indexed_last
+            and self._indexed_generation == Basic._rename_generation
+        ):
+            new_array._identifier_index = dict(self._identifier_index)
+            new_array._indexed_elements = new_array.elements
+            new_array._indexed_len = self._indexed_len
+            new_array._indexed_last = (
+                new_array.elements[-1] if new_array.elements else None
+            )
+            new_array._indexed_generation = self._indexed_generation
+
     def reverse(self) -> "BasicArray":
         """
         Reverses the order of elements in the array in-place.
@@ -247,6 +612,7 @@ class BasicArray:
             BasicArray: The current BasicArray instance with elements reversed.
         """
         self.elements.reverse()
+        self._invalidateIdentifierIndex()
         return self
 
     def reverse_copy(self) -> "BasicArray":
@@ -270,6 +636,7 @@ class BasicArray:
             element (Basic): The element to insert.
         """
         self.elements.insert(index, element)
+        self._invalidateIdentifierIndex()
 
     def getElementsIE(
         self,
@@ -299,28 +666,61 @@ class BasicArray:
         if not any([include, exclude, include_identifier, exclude_identifier]):
             return self.copy()
 
+        # Elements already passed this array's type check when they were added.
         result_array: BasicArray = BasicArray(self.element_type)
-        for element in self.elements:
-            # Use 'is not None' for checking against None
-            if include is not None and element.element_type is not include:
-                continue
-            if exclude is not None and element.element_type is exclude:
-                continue
-            # Use '!=' or '==' for string comparison, not 'is'
-            if (
-                include_identifier is not None
-                and element.identifier != include_identifier
-            ):
-                continue
-            if (
-                exclude_identifier is not None
-                and element.identifier == exclude_identifier
-            ):
-                continue
-
-            result_array.addElement(element)
+        result_array.elements = self._filterElements(
+            include, exclude, include_identifier, exclude_identifier
+        )
         return result_array
 
+    def _filterElements(
+        self,
+        include: ElementsTypes | None = None,
+        exclude: ElementsTypes | None = None,
+        include_identifier: str | None = None,
+        exclude_identifier: str | None = None,
+    ) -> List[Basic]:
+        """
+        Returns the elements that pass the `getElementsIE` filters, in order.
+        The predicate is assembled once from the active filters only.
+
+        Returns:
+            List[Basic]: A new list with the matching elements.
+        """
+        # The most common call filters by a single element type.
+        if (
+            include is not None
+            and exclude is None
+            and include_identifier is None
+            and exclude_identifier is None
+        ):
+            return _INCLUDE_TYPE_FILTERS[include](self.elements)
+
+        # Identifiers are interned (see Basic.__init__); interning the filter
+        # values too lets matching identifiers compare equal by identity.
+        if type(include_identifier) is str:
+            include_identifier = sys.intern(include_identifier)
+        if type(exclude_identifier) is str:
+            exclude_identifier = sys.intern(exclude_identifier)
+
+        # Build one predicate per active filter once, outside the loop.
+        predicates = []
+        if include is not None:
+            predicates.append(lambda element: element.element_type is include)
+        if exclude is not None:
+            predicates.append(lambda element: element.element_type is not exclude)
+        if include_identifier is not None:
+            predicates.append(lambda element: element.identifier == include_identifier)
+        if exclude_identifier is not None:
+            predicates.append(lambda element: element.identifier != exclude_identifier)
+
+        if len(predicates) == 1:
+            predicate = predicates[0]
+        else:
+            predicate = lambda element: all(check(element) for check in predicates)
+
+        return [element for element in self.elements if predicate(element)]
+
     def __iadd__(self, other: "BasicArray | Basic") -> "BasicArray":
         """
         Implements the in-place addition operator (+=).
@@ -342,7 +742,7 @@ class BasicArray:
                     f"Adding BasicArray of type {other.element_type.__name__} to "
                     f"BasicArray of type {self.element_type.__name__}. Potential type mismatch."
                 )
-            self.elements.extend(other.elements)
+            self.extend(other.elements, checked=False)
         elif isinstance(other, Basic):
             self.addElement(other)
         else:
@@ -362,10 +762,8 @@ class BasicArray:
         Returns:
             Basic | None: The element if found, otherwise None.
         """
-        for element in self.elements:
-            if element.identifier == identifier:
-                return element
-        return None
+        index = self._findIdentifierIndex(identifier)
+        return None if index is None else self.elements[index]
 
     def getElementIndex(self, identifier: str) -> int | None:
         """
@@ -377,10 +775,7 @@ class BasicArray:
         Returns:
             int | None: The index of the element if found, otherwise None.
         """
-        for index, element in enumerate(self.elements):
-            if element.identifier == identifier:
-                return index
-        return None
+        return self._findIdentifierIndex(identifier)
 
     def getElementByIndex(self, index: int) -> Basic:
         """
@@ -407,10 +802,22 @@ class BasicArray:
         """
         Removes a specific element from the array.
 
+        Elements compared by identity (no custom `__eq__`) are located through
+        the identifier index instead of comparing against every element
+        before them.
+
         Args:
             element (Basic): The element to remove.
         """
-        self.elements.remove(element)
+        position = None
+        if type(element).__eq__ is object.__eq__:
+            position = self._findIdentifierIndex(element.identifier)
+            if position is not None and self.elements[position] is not element:
+                position = None
+        if position is None:
+            # Custom equality or duplicate identifiers: keep list.remove semantics.
+            position = self.elements.index(element)
+        self._deleteAt(position)
 
     def removeElementByIndex(self, index: int):
         """
@@ -420,7 +827,53 @@ class BasicArray:
             index (int): The index of the element to remove.
         """
         if 0 <= index < len(self.elements):
-            del self.elements[index]
+            self._deleteAt(index)
+
+    def _deleteAt(self, position: int):
+        """
+        Deletes the element at a non-negative `position`. Removing the last
+        element keeps the identifier and interval indexes up to date;
+        anything else shifts the tail and drops them.
+        """
+        elements = self.elements
+        last = len(elements) - 1
+        element = elements[position]
+        del elements[position]
+        if position != last:
+            self._invalidateIdentifierIndex()
+            return
+
+        index = self._identifier_index
+        if (
+            index is not None
+            and self._indexed_elements is elements
+            and self._indexed_len == last + 1
+            and self._indexed_last is element
+            and self._indexed_generation == Basic._rename_generation
+        ):
+            if index.get(element.identifier) == position:
+                del index[element.identifier]
+            self._indexed_len = last
+            self._indexed_last = elements[-1] if elements else None
+        else:
+            self._identifier_index = None
+
+        intervals = self._intervals_sorted
+        if (
+            intervals is not None
+            and self._intervals_elements is elements
+            and self._intervals_len == last + 1
+            and self._intervals_last is element
+            and self._intervals_generation == Basic._interval_generation
+        ):
+            interval = tuple(element.source_interval)
+            removed_at = bisect.bisect_left(intervals, interval)
+            del intervals[removed_at]
+            self._updateMaxEnds(removed_at)
+            self._intervals_len = last
+            self._intervals_last = elements[-1] if elements else None
+        else:
+            self._intervals_sorted = None
 
     def getElements(self) -> List[Basic]:
         """
@@ -436,8 +889,17 @@ class BasicArray:
         Provides a string representation of the BasicArray object,
         useful for debugging and logging.
         """
-        elements_repr = ",\n".join([repr(e).strip() for e in self.elements])
-        return (
+        buffer = io.StringIO()
+        buffer.write(
             f"BasicArray(element_type={self.element_type.__name__}, count={len(self.elements)}):\n"
-            f"[\n{elements_repr}\n]"
+            "[\n"
         )
+        separator = ""
+        for element in self.elements:
+            buffer.write(separator)
+            # Some subclasses still pad their repr with a tab and a newline.
+            # strip() returns the string itself when there is nothing to trim.
+            buffer.write(repr(element).strip())
+            separator = ",\n"
+        buffer.write("\n]")
+        return buffer.getvalue()
@@ -871,6 +871,9 @@ class DeclarationArray(BasicArray):
             return element
         return None
 
+    # Spelling used by `StringFormater.notConcreteIndex2AplanStandart`.
+    findDeclWithDimentionByName = findDeclWithDimensionByName
+
     def __repr__(self) -> str:
         """
         Returns a developer-friendly string representation of the `DeclarationArray` object.
@@ -54,7 +54,7 @@ class DesignUnit(Basic):
         )  # Already upper from super().__init__
         self.ident_uniq_name_upper: str = self.ident_uniq_name.upper()
 
-        self.number: int = self.counters.get(self.counters.types.STRUCT_COUNTER)
+        self.number: int = self.counters[self.counters.types.STRUCT_COUNTER]
         self.counters.incriese(self.counters.types.STRUCT_COUNTER)
         # Initialize collections for various sub-elements within the design_unit.
         # These are instances of custom array classes, enabling structured storage and operations.
@@ -74,7 +74,7 @@ class DesignUnit(Basic):
         )  # For nested design_units or class instances
 
     def setSourceInterval(self, source_interval: Tuple[int, int]):
-        self.source_interval = source_interval
+        self.changeSourceInterval(source_interval)
 
     def setIdentifier(self, new_identifier: str, new_ident_uniq_name: str):
         """
@@ -84,7 +84,7 @@ class DesignUnit(Basic):
             new_identifier (str): The new common name for the design unit.
             new_ident_uniq_name (str): The new unique identifier for the design unit.
         """
-        self.identifier = new_identifier.upper()
+        self.changeIdentifier(new_identifier.upper())
         self.ident_uniq_name = new_ident_uniq_name
 
         # Оновлюємо кешовані версії
@@ -1,21 +1,30 @@
-from typing import Tuple
+from typing import Dict, Tuple
 from ..classes.element_types import ElementsTypes
 from ..classes.structure import Structure
 
+# Loop kinds supported by `LoopStmt` and the names used in its repr.
+_LOOP_KIND_NAMES: Dict[ElementsTypes, str] = {
+    ElementsTypes.LOOP_ELEMENT: "LoopStmt",
+    ElementsTypes.FOREVER_ELEMENT: "ForeverStmt",
+    ElementsTypes.WHILE_ELEMENT: "WhileStmt",
+}
+
 
 class LoopStmt(Structure):
     """
-    Represents a generic loop statement or block, often used as a base
-    for more specific loop types (like `forever`, `while`, `for` loops).
+    Represents a loop statement or block. The kind of loop (generic, `forever`,
+    `while`) is stored in `element_type`; `ForeverStmt` and `WhileStmt` build
+    instances of this class with the matching kind.
 
     It extends `Structure`, inheriting common properties like an identifier,
-    source code location, and nesting level. This class marks itself as a loop.
+    source code location, and nesting level.
     """
 
     def __init__(
         self,
         identifier: str,
         source_interval: Tuple[int, int],
+        kind: ElementsTypes = ElementsTypes.LOOP_ELEMENT,
     ):
         """
         Initializes a new `LoopStmt` instance.
@@ -25,134 +34,50 @@ class LoopStmt(Structure):
                               This might be a generated ID or a label for the loop.
             source_interval (Tuple[int, int]): A tuple representing the start and end
                                                 positions of the loop statement in the source code.
-            name_space_level (int): The nesting level of this loop statement within
-                                    the overall structure or namespace.
+            kind (ElementsTypes): LOOP_ELEMENT, FOREVER_ELEMENT or WHILE_ELEMENT.
         """
-        # Call the parent class (Structure) constructor.
-        # It sets the element type specifically to LOOP_ELEMENT.
+        if kind not in _LOOP_KIND_NAMES:
+            raise ValueError(f"{kind!r} is not a loop element type.")
         super().__init__(
             identifier,
             source_interval,
-            element_type=ElementsTypes.LOOP_ELEMENT,
+            element_type=kind,
         )
-        # A flag to explicitly indicate that this instance represents a loop.
-        # While the element_type also indicates this, a boolean flag can be
-        # convenient for quick checks.
-        self.is_loop: bool = True
 
-    def __repr__(self) -> str:
-        """
-        Returns a developer-friendly string representation of the `LoopStmt` object.
-        This is useful for debugging and provides a clear view of the object's state,
-        including its identifier and inherited sequence number.
-        """
-        # `identifier` is defined in this class/inherited.
-        # `sequence` is assumed to be inherited from the `Basic` or `Structure` base class.
-        return (
-            f"LoopStmt(identifier={self.identifier!r}, "
-            f"name_space_level={getattr(self, 'number', 'N/A')!r}, "  # Assuming name_space_level is stored in 'number'
-            f"sequence={getattr(self, 'sequence', 'N/A')!r})"
-        )
+    @property
+    def is_loop(self) -> bool:
+        return self.element_type in _LOOP_KIND_NAMES
 
+    @property
+    def is_forever(self) -> bool:
+        return self.element_type is ElementsTypes.FOREVER_ELEMENT
 
-class ForeverStmt(Structure):
-    """
-    Represents a 'forever' loop statement, common in hardware description
-    languages (e.g., SystemVerilog) for continuous execution.
-
-    It extends `Structure`, inheriting common properties like an identifier,
-    source code location, and nesting level. This class specifically
-    marks itself as a 'forever' loop.
-    """
-
-    def __init__(
-        self,
-        identifier: str,
-        source_interval: Tuple[int, int],
-    ):
-        """
-        Initializes a new `ForeverStmt` instance.
-
-        Args:
-            identifier (str): A unique string identifier for this forever loop.
-                              This might be a generated ID or a label for the loop.
-            source_interval (Tuple[int, int]): A tuple representing the start and end
-                                                positions of the loop statement in the source code.
-            name_space_level (int): The nesting level of this forever loop within
-                                    the overall structure or namespace.
-        """
-        # Call the parent class (Structure) constructor.
-        # It sets the element type specifically to FOREVER_ELEMENT.
-        super().__init__(
-            identifier,
-            source_interval,
-            element_type=ElementsTypes.FOREVER_ELEMENT,
-        )
-        # A flag to explicitly indicate that this instance represents a forever loop.
-        self.is_forever: bool = True
+    @property
+    def is_while(self) -> bool:
+        return self.element_type is ElementsTypes.WHILE_ELEMENT
 
     def __repr__(self) -> str:
         """
-        Returns a developer-friendly string representation of the `ForeverStmt` object.
-        This is useful for debugging and provides a clear view of the object's state,
-        including its identifier and inherited sequence number.
+        Returns a developer-friendly string representation of the loop statement,
+        named after its kind, including its identifier and inherited sequence number.
         """
-        # `identifier` is defined in this class/inherited.
-        # `sequence` is assumed to be inherited from the `Basic` or `Structure` base class.
         return (
-            f"ForeverStmt(identifier={self.identifier!r}, "
+            f"{_LOOP_KIND_NAMES[self.element_type]}(identifier={self.identifier!r}, "
             f"name_space_level={getattr(self, 'number', 'N/A')!r}, "  # Assuming name_space_level is stored in 'number'
             f"sequence={getattr(self, 'sequence', 'N/A')!r})"
         )
 
 
-class WhileStmt(Structure):
+def ForeverStmt(identifier: str, source_interval: Tuple[int, int]) -> LoopStmt:
     """
-    Represents a 'while' loop statement, a common construct in many
-    programming and hardware description languages.
-
-    It extends `Structure`, inheriting common properties like an identifier,
-    source code location, and nesting level. This class specifically
-    marks itself as a 'while' loop. Additional attributes for the loop's
-    condition could be added here if needed.
+    Creates a 'forever' loop statement, common in hardware description
+    languages (e.g., SystemVerilog) for continuous execution.
     """
+    return LoopStmt(identifier, source_interval, ElementsTypes.FOREVER_ELEMENT)
 
-    def __init__(
-        self,
-        identifier: str,
-        source_interval: Tuple[int, int],
-    ):
-        """
-        Initializes a new `WhileStmt` instance.
 
-        Args:
-            identifier (str): A unique string identifier for this while loop.
-                              This might be a generated ID or a label for the loop.
-            source_interval (Tuple[int, int]): A tuple representing the start and end
-                                                positions of the loop statement in the source code.
-            name_space_level (int): The nesting level of this while loop within
-                                    the overall structure or namespace.
-        """
-        # Call the parent class (Structure) constructor.
-        # It sets the element type specifically to WHILE_ELEMENT.
-        super().__init__(
-            identifier,
-            source_interval,
-            element_type=ElementsTypes.WHILE_ELEMENT,
-        )
-        # A flag to explicitly indicate that this instance represents a while loop.
-        self.is_while: bool = True
-
-    def __repr__(self) -> str:
-        """
-        Returns a developer-friendly string representation of the `WhileStmt` object.
-        This is useful for debugging and provides a clear view of the object's state,
-        including its identifier and inherited sequence number.
-        """
-        # `identifier` is defined in this class/inherited.
-        # `sequence` is assumed to be inherited from the `Basic` or `Structure` base class.
-        return (
-            f"WhileStmt(identifier={self.identifier!r}, "
-            f"name_space_level={getattr(self, 'number', 'N/A')!r}, "  # Assuming name_space_level is stored in 'number'
-            f"sequence={getattr(self, 'sequence', 'N/A')!r})"
-        )
+def WhileStmt(identifier: str, source_interval: Tuple[int, int]) -> LoopStmt:
+    """
+    Creates a 'while' loop statement.
+    """
+    return LoopStmt(identifier, source_interval, ElementsTypes.WHILE_ELEMENT)
@@ -228,8 +228,11 @@ class NodeArray(BasicArray):
         if not isinstance(new_element, Node):
             # Ensure logger is initialized (as per the __init__ update)
             self.logger.warning(
-                f"Object should be of type {Node.__name__} but you passed an "
-                f"object of type {type(new_element).__name__}. Object: {new_element}",
+                "Object should be of type %s but you passed an "
+                "object of type %s. Object: %s",
+                Node.__name__,
+                type(new_element).__name__,
+                new_element,
             )
         return len(self) - 1
 
@@ -140,9 +140,7 @@ class ParametrArray(BasicArray):
             index (int): The index at which to insert the element.
             element (Parametr): The `Parametr` object to insert.
         """
-        # The original code ` {self.elements.insert(index, element)} ` was a syntax error.
-        # It should be a direct call to the list's insert method.
-        self.elements.insert(index, element)
+        super().insert(index, element)
 
     def addElement(self, new_element: Parametr) -> Tuple[bool, int | None]:
         """
@@ -61,7 +61,7 @@ class Structure(Basic):
         if number:
             self.number = number
         else:
-            self.number: int = self.counters.get(self.counters.types.STRUCT_COUNTER)
+            self.number: int = self.counters[self.counters.types.STRUCT_COUNTER]
         self.counters.incriese(self.counters.types.STRUCT_COUNTER)
 
         # `inside_the_task` flag influences how parameters are handled when adding new protocols.
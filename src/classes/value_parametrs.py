@@ -1,6 +1,47 @@
-from typing import List, Optional, Tuple, Union, overload
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, overload
+import bisect
+import functools
 from ..classes.basic import Basic, BasicArray
 from ..classes.element_types import ElementsTypes
+from ..utils.string_formater import (
+    addBracketsAfterNegation,
+    addBracketsAfterTilda,
+    addLeftValueForUnaryOrOperator,
+    addSpacesAroundOperators,
+    doubleOperators2Aplan,
+    generatePythonStyleTernary,
+    replace_cpp_operators,
+    valuesToAplanStandart,
+    vectorSizes2AplanStandart,
+)
+
+
+# Marks a miss in `ValueParametrArray._evaluation_cache`.
+_NOT_CACHED = object()
+
+
+@functools.lru_cache(maxsize=4096)
+def _prepareExpression(expression: str) -> str:
+    """
+    Applies the Aplan formatting rules of `ValueParametr.prepareExpression`.
+    All steps are pure string transformations, so results are cached: the same
+    parameter expressions (`WIDTH-1`, `2**N`, ...) repeat across a design.
+    """
+    expression = valuesToAplanStandart(expression)
+    expression = doubleOperators2Aplan(expression)
+    expression = addLeftValueForUnaryOrOperator(expression)
+    expression = addSpacesAroundOperators(expression)
+    expression = addBracketsAfterNegation(expression)
+    expression = addBracketsAfterTilda(expression)
+    expression = vectorSizes2AplanStandart(expression)
+    expression = replace_cpp_operators(expression)
+    expression = generatePythonStyleTernary(expression)
+    return expression
+
+
+def _identifierLengthKey(element: "ValueParametr") -> int:
+    """Sort key of `ValueParametrArray`: longest identifier first."""
+    return -len(element.identifier)
 
 
 class ValueParametr(Basic):
@@ -11,6 +52,9 @@ class ValueParametr(Basic):
     It extends the `Basic` class for fundamental identification and source tracking.
     """
 
+    # Together with Basic.__slots__ this leaves instances without a __dict__.
+    __slots__ = ("value", "expression")
+
     def __init__(
         self,
         identifier: str,
@@ -58,36 +102,24 @@ class ValueParametr(Basic):
     def prepareExpression(self) -> None:
         """
         Pre-processes and formats the `expression` string to a standardized Aplan format.
-        This involves applying a series of transformations using utility methods
-        from `self.string_formater`. The `expression` attribute is modified in-place.
+        This involves applying a series of transformations from `string_formater`
+        (cached per expression string). The `expression` attribute is modified in-place.
 
         Precondition: `self.string_formater` must be initialized and accessible.
         """
         if self.expression is None:
             return  # No expression to prepare
 
-        # The existence of self.string_formater is an implicit dependency.
-        # It should be initialized in `Basic` or explicitly passed/imported.
-        if not hasattr(self, "string_formater") or self.string_formater is None:
+        # `string_formater` is a class attribute inherited from `Basic`, so a
+        # plain None check is enough (no per-call `hasattr`).
+        if self.string_formater is None:
             self.logger.warning(
-                f"`string_formater` not available for ValueParametr '{self.identifier}'. Expression not prepared."
+                "`string_formater` not available for ValueParametr '%s'. Expression not prepared.",
+                self.identifier,
             )
             return
 
-        expression = self.expression
-
-        # Apply various string formatting and transformation rules
-        expression = self.string_formater.valuesToAplanStandart(expression)
-        expression = self.string_formater.doubleOperators2Aplan(expression)
-        expression = self.string_formater.addLeftValueForUnaryOrOperator(expression)
-        expression = self.string_formater.addSpacesAroundOperators(expression)
-        expression = self.string_formater.addBracketsAfterNegation(expression)
-        expression = self.string_formater.addBracketsAfterTilda(expression)
-        expression = self.string_formater.vectorSizes2AplanStandart(expression)
-        expression = self.string_formater.replace_cpp_operators(expression)
-        expression = self.string_formater.generatePythonStyleTernary(expression)
-
-        self.expression = expression  # Update the instance's expression
+        self.expression = _prepareExpression(self.expression)
 
     def __str__(self) -> str:
         """
@@ -130,6 +162,9 @@ class ValueParametrArray(BasicArray):
             ValueParametr
         )  # Configure BasicArray to hold ValueParametr objects
 
+        # Results of `evaluateParametrExpressionByIndex`.
+        self._evaluation_cache: Dict[tuple, Any] = {}
+
         # Assumption: `self.string_formater` and `self.utils` are available,
         # likely inherited from BasicArray or a common utility base class.
         # self.string_formater: 'StringFormater' = StringFormater() # Example if initialized here
@@ -147,8 +182,10 @@ class ValueParametrArray(BasicArray):
                                 original parameters.
         """
         new_array = ValueParametrArray()
-        for element in self.elements:  # Iterate directly over the internal list
-            new_array.addElement(element.copy())  # Use ValueParametr's deep copy method
+        # The copies keep the order and the already prepared expressions (the
+        # strings themselves are shared), so `addElement` is not needed.
+        new_array.elements = [element.copy() for element in self.elements]
+        self._shareIdentifierIndex(new_array)
         return new_array
 
     def getElementByIndex(self, index: int) -> "ValueParametr":
@@ -188,42 +225,28 @@ class ValueParametrArray(BasicArray):
         Returns:
             ValueParametrArray: A new `ValueParametrArray` containing only the parameters
                                 that match all specified filtering criteria. If no criteria
-                                are provided, a deep copy of the original array is returned.
+                                are provided, it holds all parameters of this array.
         """
         result_array: "ValueParametrArray" = ValueParametrArray()
 
-        # If no filters are specified, return a deep copy of the entire array.
-        if all(
-            arg is None
-            for arg in [
-                include_type,
-                exclude_type,
-                include_identifier,
-                exclude_identifier,
-            ]
+        # If no filters are specified, return every parameter. Like the
+        # filtered result, the new array shares the parameter objects; only
+        # the list is new, so callers may still add to or remove from it.
+        if (
+            include_type is None
+            and exclude_type is None
+            and include_identifier is None
+            and exclude_identifier is None
         ):
-            return self.copy()
-
-        for element in self.elements:
-            # Apply element_type filters
-            if include_type is not None and element.element_type is not include_type:
-                continue
-            if exclude_type is not None and element.element_type is exclude_type:
-                continue
-
-            # Apply identifier filters (use `==` for string comparison, not `is`)
-            if (
-                include_identifier is not None
-                and element.identifier != include_identifier
-            ):
-                continue
-            if (
-                exclude_identifier is not None
-                and element.identifier == exclude_identifier
-            ):
-                continue
-
-            result_array.addElement(element)  # Add the element if it passes all filters
+            result_array.elements = list(self.elements)
+            self._shareIdentifierIndex(result_array)
+            return result_array
+
+        # A filtered subsequence of a sorted array is still sorted and its
+        # expressions are already prepared, so `addElement` is not needed.
+        result_array.elements = self._filterElements(
+            include_type, exclude_type, include_identifier, exclude_identifier
+        )
         return result_array
 
     def addElement(self, new_element: "ValueParametr") -> int:
@@ -241,7 +264,12 @@ class ValueParametrArray(BasicArray):
         Raises:
             TypeError: If the `new_element` is not an instance of `ValueParametr`.
         """
-        if not isinstance(new_element, self.element_type):
+        # Exact-type test first: parameters are plain ValueParametr objects, and
+        # `isinstance` is only needed for subclasses.
+        element_type = self.element_type
+        if type(new_element) is not element_type and not isinstance(
+            new_element, element_type
+        ):
             raise TypeError(
                 f"Object should be of type {self.element_type.__name__} but "
                 f"you passed an object of type {type(new_element).__name__}. \n"
@@ -249,22 +277,109 @@ class ValueParametrArray(BasicArray):
             )
 
         new_element.prepareExpression()  # Prepare expression immediately upon adding
-        self.elements.append(new_element)
-
-        # WARNING: This sorting operation is O(N log N) and can be very inefficient
-        # if elements are added one by one to a large array.
-        # Consider if this sorting is truly necessary after every add, or if it can
-        # be done once at the end, or if a different data structure (e.g., a sorted list
-        # implementation or a more optimized insertion strategy) is required.
-        # Also, this implementation allows duplicate identifiers, unlike some other `addElement` methods.
-        self.elements = sorted(
-            self.elements,
-            key=lambda element: len(element.identifier),
-            reverse=True,  # Sorts by length of identifier, longest first
+
+        # The elements are kept sorted by identifier length, longest first, so
+        # the new element is inserted in place instead of re-sorting the array.
+        # Inserting after existing elements of the same length matches a stable
+        # sort. Duplicate identifiers are allowed here, unlike some other
+        # `addElement` methods.
+        elements = self.elements
+        key = _identifierLengthKey(new_element)
+        position = bisect.bisect_right(elements, key, key=_identifierLengthKey)
+        if position == len(elements):
+            # Appending keeps the identifier index usable (see BasicArray).
+            elements.append(new_element)
+        else:
+            self.insert(position, new_element)
+
+        # Equal identifiers have equal lengths, so any earlier duplicate sits in
+        # the same length group just before `position`; return the first one.
+        identifier = new_element.identifier
+        group_start = bisect.bisect_left(
+            elements, key, 0, position, key=_identifierLengthKey
         )
-        # The index returned here might not be the actual index before sorting,
-        # but it will be its index after the current sort.
-        return self.getElementIndex(new_element.identifier)
+        for index in range(group_start, position):
+            if elements[index].identifier == identifier:
+                return index
+        return position
+
+    def extend(
+        self,
+        new_elements: Iterable["ValueParametr"],
+        checked: bool = True,
+        prepare: bool = True,
+    ):
+        """
+        Adds several `ValueParametr` elements at once. Same result as calling
+        `addElement` for each of them, but the array is sorted only once.
+        The existing elements form an already sorted run, so the sort mostly
+        merges the new elements in.
+
+        Args:
+            new_elements (Iterable[ValueParametr]): The parameters to add.
+            checked (bool): Whether to type-check the new elements.
+            prepare (bool): Whether to run `prepareExpression` on the new
+                            elements. Pass False for parameters taken from
+                            another `ValueParametrArray`, which are already
+                            prepared.
+
+        Raises:
+            TypeError: If `checked` and an element is not a `ValueParametr`.
+        """
+        elements = self.elements
+        element_type = self.element_type
+        try:
+            for new_element in new_elements:
+                if (
+                    checked
+                    and type(new_element) is not element_type
+                    and not isinstance(new_element, element_type)
+                ):
+                    raise TypeError(
+                        f"Object should be of type {element_type.__name__} but "
+                        f"you passed an object of type {type(new_element).__name__}. \n"
+                        f"Object: {new_element!r}"
+                    )
+                if prepare:
+                    new_element.prepareExpression()
+                elements.append(new_element)
+        finally:
+            # Keep the elements added before a failure in order as well.
+            elements.sort(key=_identifierLengthKey)  # stable: keeps insertion order
+            self._invalidateIdentifierIndex()
+
+    def __iadd__(self, other: "BasicArray | ValueParametr") -> "ValueParametrArray":
+        """
+        Adds another array or a single parameter, keeping the length order.
+        Parameters from another `ValueParametrArray` are not prepared again.
+        """
+        if isinstance(other, ValueParametrArray):
+            self.extend(other.elements, checked=False, prepare=False)
+            return self
+        return super().__iadd__(other)
+
+    def _referencedParametrs(self, expression: str) -> Optional[List["ValueParametr"]]:
+        """
+        Returns the parameters whose identifier occurs in `expression`, in
+        array order. Only these can be substituted by
+        `replaceValueParametrsCalls`, as long as their values are plain ints:
+        the digits put in their place cannot form another identifier.
+
+        Args:
+            expression (str): The prepared expression of a parameter.
+
+        Returns:
+            Optional[List[ValueParametr]]: The referenced parameters, or None if
+                                           one of them holds a non-int value
+                                           (its text could itself be substituted).
+        """
+        referenced = []
+        for element in self.elements:
+            if element.identifier in expression:
+                if type(element.value) is not int:
+                    return None
+                referenced.append(element)
+        return referenced
 
     def evaluateParametrExpressionByIndex(self, index: int) -> Union[int, str]:
         """
@@ -290,27 +405,53 @@ class ValueParametrArray(BasicArray):
             return parametr.value  # Return current value if no expression
 
         if len(expression) > 0:
-            # Assumption: `self.string_formater` and `self.utils` are available.
-            if not hasattr(self, "string_formater") or self.string_formater is None:
+            # `cache_key`: the expression plus the (identifier, value) pairs of
+            # the referenced parameters, i.e. every input of the substitution.
+            referenced = self._referencedParametrs(expression)
+            cache_key = None
+            if referenced is not None:
+                cache_key = (
+                    expression,
+                    tuple(
+                        (element.identifier, element.value) for element in referenced
+                    ),
+                )
+                cached_value = self._evaluation_cache.get(cache_key, _NOT_CACHED)
+                if cached_value is not _NOT_CACHED:
+                    parametr.value = cached_value
+                    return cached_value
+
+            # `string_formater` and `utils` are class attributes of BasicArray;
+            # read each once instead of probing them with `hasattr`.
+            string_formater = self.string_formater
+            utils = self.utils
+            if string_formater is None:
                 self.logger.warning(
-                    f"`string_formater` not available for ValueParametrArray. Cannot substitute calls."
+                    "`string_formater` not available for ValueParametrArray. Cannot substitute calls."
                 )
                 # Fallback: attempt to evaluate without substitution
             else:
                 # Replace references to other ValueParametrs in the expression
-                expression = self.string_formater.replaceValueParametrsCalls(
-                    self, expression
+                parametrs = self
+                if referenced is not None and len(referenced) < len(self.elements):
+                    # Substitute only the referenced parameters.
+                    parametrs = ValueParametrArray()
+                    parametrs.elements = referenced
+                expression = string_formater.replaceValueParametrsCalls(
+                    parametrs, expression
                 )
 
-            if not hasattr(self, "utils") or self.utils is None:
+            if utils is None:
                 self.logger.warning(
-                    f"`utils` (expression evaluator) not available. Cannot evaluate expression."
+                    "`utils` (expression evaluator) not available. Cannot evaluate expression."
                 )
                 return expression  # Return raw expression if no evaluator
 
             # Evaluate the final expression string
-            evaluated_value = self.utils.evaluateExpression(expression)
+            evaluated_value = utils.evaluateExpression(expression)
             parametr.value = evaluated_value  # Update the parameter's value
+            if cache_key is not None:
+                self._evaluation_cache[cache_key] = evaluated_value
             return evaluated_value
         return parametr.value  # Return current value if expression is empty
 
@@ -1,7 +1,12 @@
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, Literal, Optional
+from typing import Dict, FrozenSet, Literal, Optional, Set, get_args
+import atexit
+import functools
 import logging
+import queue
+import threading
 
 from ..singleton.singleton import SingletonMeta
 import colorlog
@@ -95,9 +100,107 @@ LOG_COLORS = Literal[
 ]
 
 
+# Colour names accepted by the `color=` argument of the Logger methods.
+_VALID_COLORS: FrozenSet[str] = frozenset(get_args(LOG_COLORS))
+
+_COLOR_ESCAPES: Dict[str, str] = {
+    name: colorlog.escape_codes.parse_colors(name) for name in _VALID_COLORS
+}
+
+
+def _color_escape(color: str) -> str:
+    """Returns the ANSI escape sequence for a colour name."""
+    escape = _COLOR_ESCAPES.get(color)
+    if escape is None:
+        escape = colorlog.escape_codes.parse_colors(color)
+    return escape
+
+
+_INITIAL_LOG_COLORS: Dict[str, str] = {
+    "DEBUG": "cyan",
+    "INFO": "green",
+    "WARNING": "yellow",
+    "ERROR": "red",
+    "CRITICAL": "bold_red",
+}
+
+_SECONDARY_LOG_COLORS: Dict[str, Dict[str, str]] = {
+    "level": {
+        "DEBUG": "blue",
+        "INFO": "green",
+        "WARNING": "yellow",
+        "ERROR": "red",
+        "CRITICAL": "red",
+    },
+    "time": {
+        "DEBUG": "blue",
+        "INFO": "green",
+        "WARNING": "yellow",
+        "ERROR": "red",
+        "CRITICAL": "red",
+    },
+    "module": {
+        "DEBUG": "light_cyan",
+        "INFO": "light_cyan",
+        "WARNING": "light_cyan",
+        "ERROR": "light_cyan",
+        "CRITICAL": "light_cyan",
+    },
+}
+
+_CONSOLE_FORMAT = "%(time_log_color)s%(asctime)s%(reset)s %(light_cyan)s|%(reset)s %(module_log_color)s%(name)s%(reset)s %(light_cyan)s|%(reset)s %(level_log_color)s%(levelname)s%(reset)s %(light_cyan)s|%(reset)s %(log_color)s%(message)s%(reset)s"
+
+
+class CustomColoredFormatter(colorlog.ColoredFormatter):
+    """
+    Colored console formatter that honours a per-record ``temp_log_color``
+    passed through ``extra`` to recolour the message.
+    """
+
+    def formatMessage(self, record):
+        temp_color = record.__dict__.get("temp_log_color")
+        if not temp_color:
+            return super().formatMessage(record)
+
+        # Override the message colour on a per-record copy of the escape map
+        # instead of mutating the shared `log_colors` dict, which keeps the
+        # formatter safe to use from several threads.
+        escapes = self._escape_code_map(record.levelname)
+        if escapes["reset"]:  # empty when colouring is disabled
+            escapes["log_color"] = _color_escape(temp_color)
+        message = logging.Formatter.formatMessage(
+            self, colorlog.formatter.ColoredRecord(record, escapes)
+        )
+        return self._append_reset(message, escapes)
+
+
+@functools.lru_cache(maxsize=64)
+def _delimiter_line(size: int) -> str:
+    return "=" * size
+
+
+# Directories already created by the file handlers during this run.
+_CREATED_DIRECTORIES: Set[Path] = set()
+
+
+def _ensureDirectory(directory: Path) -> None:
+    """Creates `directory` (with parents) once per process."""
+    if directory not in _CREATED_DIRECTORIES:
+        directory.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRECTORIES.add(directory)
+
+
+# Aplan files are written in bulk, so they get a large write buffer.
+_APLAN_FILE_BUFFER_SIZE = 1 << 20
+
+
 class LogAplanFileHandler(logging.FileHandler):
     """
     A custom handler for logs that writes them to a .act file
+
+    Records are written without a per-record flush; the buffered file is
+    flushed when the handler is flushed or closed (at the latest by
+    `logging.shutdown` at exit).
     """
 
     def __init__(self, directory: str, name: str, level: int = logging.NOTSET) -> None:
@@ -105,12 +208,39 @@ class LogAplanFileHandler(logging.FileHandler):
 
         final_path = log_directory / name
 
-        final_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensureDirectory(final_path.parent)
 
         super().__init__(final_path, encoding="utf-8")
 
         self.setLevel(level)
 
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=_APLAN_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        stream = self.stream
+        if stream is None:
+            # Closed handler: let FileHandler decide whether to reopen.
+            super().emit(record)
+            return
+        try:
+            if self.formatter is None and not record.exc_info and not record.stack_info:
+                # Same text the default formatter would produce.
+                msg = record.getMessage()
+            else:
+                msg = self.format(record)
+            stream.write(msg + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 
 class LogFileHandler(logging.FileHandler):
     """
@@ -118,15 +248,22 @@ class LogFileHandler(logging.FileHandler):
     with a dynamic name that includes a timestamp.
     """
 
-    def __init__(self, full_path: str, level: int = logging.NOTSET) -> None:
+    def __init__(
+        self,
+        full_path: str,
+        level: int = logging.NOTSET,
+        timestamp: Optional[str] = None,
+    ) -> None:
         file_path = Path(full_path)
 
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        if timestamp is None:
+            # Every log file of a run shares the manager's start timestamp.
+            timestamp = LoggerManager().run_timestamp
         filename_with_timestamp = f"{file_path.stem}_{timestamp}{file_path.suffix}"
 
         final_path = file_path.parent / filename_with_timestamp
 
-        final_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensureDirectory(final_path.parent)
 
         super().__init__(final_path, encoding="utf-8")
 
@@ -155,82 +292,120 @@ class LogElementHandler(logging.Handler):
             self.handleError(record)
 
 
-class Logger:
-    active = False
-    _temp_log_color: Optional[str] = None
+class _ConsoleQueueHandler(QueueHandler):
+    """
+    Enqueues records together with the console handler of their Logger, so
+    one shared listener can write them through the right formatter.
+    """
 
-    def __init__(self, name):
-        self.active = True
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.INFO)
+    def __init__(self, record_queue: queue.SimpleQueue, console_handler):
+        super().__init__(record_queue)
+        self.console_handler = console_handler
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        item = (self.console_handler, record)
+        if _CONSOLE_LISTENER.running:
+            self.queue.put_nowait(item)
+        else:
+            # No listener thread (after atexit, or in a forked child, which
+            # does not inherit it): write on the calling thread instead.
+            _CONSOLE_LISTENER.handle(item)
 
-        console_handler = logging.StreamHandler()
 
-        self._initial_log_colors = {
-            "DEBUG": "cyan",
-            "INFO": "green",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "bold_red",
-        }
+class _ConsoleQueueListener(QueueListener):
+    """
+    Writes the records of every Logger on a single thread, in the order they
+    were logged.
+    """
 
-        class CustomColoredFormatter(colorlog.ColoredFormatter):
-            def format(self, record):
-                original_level_color = self.log_colors.get(record.levelname)
-                original_message_color = self.log_colors.get("message")
+    def __init__(self, record_queue: queue.SimpleQueue):
+        super().__init__(record_queue)
 
-                if hasattr(record, "temp_log_color") and record.temp_log_color:
-                    temp_color = record.temp_log_color
-                    self.log_colors[record.levelname] = temp_color
-                    self.log_colors["message"] = temp_color
+    def handle(self, item) -> None:
+        if isinstance(item, threading.Event):
+            item.set()
+            return
+        console_handler, record = item
+        if record.levelno >= console_handler.level:
+            console_handler.handle(record)
+
+    @property
+    def running(self) -> bool:
+        """Whether the listener thread is alive in this process."""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def flush(self) -> None:
+        """Blocks until every record queued so far has been written."""
+        if not self.running:
+            return
+        drained = threading.Event()
+        self.queue.put_nowait(drained)
+        drained.wait()
 
-                result = super().format(record)
 
-                if hasattr(record, "temp_log_color") and record.temp_log_color:
-                    if original_level_color:
-                        self.log_colors[record.levelname] = original_level_color
-                    else:
-                        self.log_colors.pop(record.levelname, None)
+# Records are only enqueued on the calling thread; colouring and the write to
+# stderr happen on one listener thread shared by all loggers.
+_CONSOLE_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_CONSOLE_LISTENER = _ConsoleQueueListener(_CONSOLE_QUEUE)
+_CONSOLE_LISTENER.start()
+atexit.register(_CONSOLE_LISTENER.stop)
 
-                    if original_message_color:
-                        self.log_colors["message"] = original_message_color
-                    else:
-                        self.log_colors.pop("message", None)
 
-                return result
+class Logger:
+    __slots__ = (
+        "logger",
+        "formatter",
+        "_initial_log_colors",
+    )
 
+    def __init__(self, name):
+        self.logger = logging.getLogger(name)
+        self.logger.disabled = False
+        self.logger.setLevel(logging.INFO)
+
+        console_handler = logging.StreamHandler()
+
+        self._initial_log_colors = dict(_INITIAL_LOG_COLORS)
         self.formatter = CustomColoredFormatter(
-            "%(time_log_color)s%(asctime)s%(reset)s %(light_cyan)s|%(reset)s %(module_log_color)s%(name)s%(reset)s %(light_cyan)s|%(reset)s %(level_log_color)s%(levelname)s%(reset)s %(light_cyan)s|%(reset)s %(log_color)s%(message)s%(reset)s",
+            _CONSOLE_FORMAT,
             log_colors=self._initial_log_colors,
-            secondary_log_colors={
-                "level": {
-                    "DEBUG": "blue",
-                    "INFO": "green",
-                    "WARNING": "yellow",
-                    "ERROR": "red",
-                    "CRITICAL": "red",
-                },
-                "time": {
-                    "DEBUG": "blue",
-                    "INFO": "green",
-                    "WARNING": "yellow",
-                    "ERROR": "red",
-                    "CRITICAL": "red",
-                },
-                "module": {
-                    "DEBUG": "light_cyan",
-                    "INFO": "light_cyan",
-                    "WARNING": "light_cyan",
-                    "ERROR": "light_cyan",
-                    "CRITICAL": "light_cyan",
-                },
-            },
+            secondary_log_colors=_SECONDARY_LOG_COLORS,
             style="%",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
 
         console_handler.setFormatter(self.formatter)
-        self.logger.addHandler(console_handler)
+
+        self.logger.addHandler(_ConsoleQueueHandler(_CONSOLE_QUEUE, console_handler))
+
+    def flush(self):
+        """
+        Blocks until every record queued so far, by any logger, has been
+        written to the console.
+        """
+        _CONSOLE_LISTENER.flush()
+
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        Tells whether a record of `level` would be emitted. Use it to skip
+        building expensive log arguments, e.g. ``if logger.isEnabledFor(logging.DEBUG):``.
+        """
+        return self.logger.isEnabledFor(level)
+
+    @property
+    def info_enabled(self) -> bool:
+        """Shortcut for ``isEnabledFor(logging.INFO)``."""
+        return self.logger.isEnabledFor(logging.INFO)
+
+    @property
+    def active(self) -> bool:
+        """Mirrors the underlying logger's ``disabled`` flag."""
+        return not self.logger.disabled
+
+    @active.setter
+    def active(self, value: bool):
+        self.logger.disabled = not value
 
     def activate(self):
         self.active = True
@@ -238,49 +413,56 @@ class Logger:
     def deactivate(self):
         self.active = False
 
-    def _log_with_temp_color(self, level, msg: str, color: Optional[str] = None):
-        extra_kwargs = {}
-        if color:
-            extra_kwargs["extra"] = {"temp_log_color": color}
-        self.logger.log(level, msg, **extra_kwargs)
+    def _log_with_temp_color(self, level, msg: str, *args, color: Optional[str] = None):
+        """
+        Forwards the record to the underlying logger. ``args`` are merged into
+        ``msg`` with %-formatting only if the record is actually emitted, so
+        callers should prefer ``logger.debug("value=%s", value)`` over f-strings.
 
-    def nonset(self, msg: str, color: Optional[LOG_COLORS] = None):
-        if self.active:
-            self._log_with_temp_color(logging.NOTSET, msg, color)
+        Raises:
+            ValueError: If ``color`` is not one of ``LOG_COLORS``.
+        """
+        logger = self.logger
+        if not logger.isEnabledFor(level):
+            return
+        if color and color not in _VALID_COLORS:
+            raise ValueError(f"Unknown log color {color!r}.")
+        logger.log(
+            level, msg, *args, extra={"temp_log_color": color} if color else None
+        )
 
-    def debug(self, msg: str, color: Optional[LOG_COLORS] = None):
-        if self.active:
-            self._log_with_temp_color(logging.DEBUG, msg, color)
+    def nonset(self, msg: str, *args, color: Optional[LOG_COLORS] = None):
+        self._log_with_temp_color(logging.NOTSET, msg, *args, color=color)
 
-    def info(self, msg: str, color: Optional[LOG_COLORS] = None):
-        if self.active:
-            self._log_with_temp_color(logging.INFO, msg, color)
+    def debug(self, msg: str, *args, color: Optional[LOG_COLORS] = None):
+        self._log_with_temp_color(logging.DEBUG, msg, *args, color=color)
 
-    def warning(self, msg: str, color: Optional[LOG_COLORS] = None):
-        if self.active:
-            self._log_with_temp_color(logging.WARNING, msg, color)
+    def info(self, msg: str, *args, color: Optional[LOG_COLORS] = None):
+        self._log_with_temp_color(logging.INFO, msg, *args, color=color)
 
-    def error(self, msg: str, color: Optional[LOG_COLORS] = None):
-        if self.active:
-            self._log_with_temp_color(logging.ERROR, msg, color)
+    def warning(self, msg: str, *args, color: Optional[LOG_COLORS] = None):
+        self._log_with_temp_color(logging.WARNING, msg, *args, color=color)
 
-    def critical(self, msg: str, color: Optional[LOG_COLORS] = None):
-        if self.active:
-            self._log_with_temp_color(logging.CRITICAL, msg, color)
+    def error(self, msg: str, *args, color: Optional[LOG_COLORS] = None):
+        self._log_with_temp_color(logging.ERROR, msg, *args, color=color)
+
+    def critical(self, msg: str, *args, color: Optional[LOG_COLORS] = None):
+        self._log_with_temp_color(logging.CRITICAL, msg, *args, color=color)
 
     def delimetr(self, size: int = 100, color: LOG_COLORS = "white", text: str = ""):
-        if not self.active:
+        if not self.logger.isEnabledFor(logging.INFO):
             return
 
-        delimiter_char = "="
-        base_delimiter_string = delimiter_char * size
+        base_delimiter_string = _delimiter_line(size)
 
         if text:
-            self.info(base_delimiter_string, color)
-            self.info(text, color)
-            self.info(base_delimiter_string, color)
+            # One record for the whole banner: a single format + write.
+            self.info(
+                f"{base_delimiter_string}\n{text}\n{base_delimiter_string}",
+                color=color,
+            )
         else:
-            self.info(base_delimiter_string, color)
+            self.info(base_delimiter_string, color=color)
 
 
 class LoggerManager(metaclass=SingletonMeta):
@@ -291,18 +473,19 @@ class LoggerManager(metaclass=SingletonMeta):
     def __init__(self):
         self._loggers: Dict[str, Logger] = {}
         self._is_setup = False
+        self.run_timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
     def getLogger(self, name: str) -> Logger:
         """
         Повертає логер для вказаного імені.
         Якщо логер не існує, він створюється і додається до масиву.
         """
+        logger = self._loggers.get(name)
+        if logger is None:
+            logger = self._loggers[name] = Logger(name)
+            logger.activate()
 
-        if name not in self._loggers:
-            self._loggers[name] = Logger(name)
-            self._loggers[name].activate()
-
-        return self._loggers[name]
+        return logger
 
     # CRITICAL = 50
     # FATAL = CRITICAL
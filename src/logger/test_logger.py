@@ -1,7 +1,10 @@
 import logging
+import os
+import signal
+import time
 import pytest
 from io import StringIO
-from ..logger.logger import Logger, LoggerManager
+from ..logger.logger import LogAplanFileHandler, LogFileHandler, Logger, LoggerManager
 
 
 # --------------------------
@@ -63,3 +66,197 @@ def test_logger_activate_deactivate_cycle(logger_instance, log_capture):
     logger_instance.activate()
     logger_instance.info("Should appear")
     assert "Should appear" in log_capture.getvalue()
+
+
+def test_logger_lazy_formatting_args(logger_instance, log_capture):
+    """
+    Test that positional arguments are merged into the message with %-formatting.
+    """
+    logger_instance.activate()
+    logger_instance.info("value=%s, count=%d", "abc", 3)
+    assert "value=abc, count=3" in log_capture.getvalue()
+
+
+def test_logger_lazy_formatting_skipped_below_level(logger_instance, log_capture):
+    """
+    Test that arguments are not formatted when the level is disabled.
+    """
+
+    class Explosive:
+        def __str__(self):
+            raise AssertionError("should not be formatted")
+
+    logger_instance.activate()
+    logger_instance.logger.setLevel(logging.INFO)
+    logger_instance.debug("value=%s", Explosive())
+    assert log_capture.getvalue() == ""
+
+
+def test_logger_delimetr_skipped_below_level(logger_instance, log_capture):
+    """
+    Test that delimetr emits nothing when INFO is disabled.
+    """
+    logger_instance.activate()
+    logger_instance.logger.setLevel(logging.WARNING)
+    logger_instance.delimetr(text="hidden")
+    assert log_capture.getvalue() == ""
+
+
+def test_logger_delimetr_with_text_single_record(logger_instance, log_capture):
+    """
+    Test that a delimiter with text is emitted as one multi-line record.
+    """
+    logger_instance.activate()
+    logger_instance.logger.setLevel(logging.INFO)
+    logger_instance.delimetr(size=5, text="TITLE")
+    assert log_capture.getvalue() == "=====\nTITLE\n=====\n"
+
+
+def test_formatter_temp_color_does_not_mutate_log_colors():
+    """
+    Test that a temporary colour is applied to the message without changing
+    the formatter's shared log_colors mapping.
+    """
+    logger = Logger("FormatterTest")
+    formatter = logger.formatter
+    formatter.force_color = True
+    before = dict(formatter.log_colors)
+
+    record = logging.LogRecord(
+        "FormatterTest", logging.INFO, __file__, 0, "colored", None, None
+    )
+    record.temp_log_color = "purple"
+    output = formatter.format(record)
+
+    assert "\033[35mcolored" in output
+    assert formatter.log_colors == before
+
+
+def test_logger_isEnabledFor(logger_instance, log_capture):
+    """
+    Test that isEnabledFor follows both the level and the active flag.
+    """
+    logger_instance.activate()
+    logger_instance.logger.setLevel(logging.INFO)
+    assert logger_instance.isEnabledFor(logging.WARNING)
+    assert not logger_instance.isEnabledFor(logging.DEBUG)
+
+    logger_instance.deactivate()
+    assert not logger_instance.isEnabledFor(logging.WARNING)
+    assert not logger_instance.info_enabled
+    logger_instance.activate()
+    assert logger_instance.info_enabled
+
+
+def test_logger_deactivate_uses_disabled_flag(logger_instance):
+    """
+    Test that activate/deactivate toggle the stdlib logger's disabled flag.
+    """
+    logger_instance.deactivate()
+    assert logger_instance.logger.disabled
+    assert not logger_instance.active
+    logger_instance.activate()
+    assert not logger_instance.logger.disabled
+    assert logger_instance.active
+
+
+def test_aplan_file_handler_buffers_until_flush(tmp_path):
+    """
+    Test that the Aplan file handler writes plain messages and that they
+    reach the file on flush.
+    """
+    handler = LogAplanFileHandler(str(tmp_path), "out.act")
+    logger = logging.getLogger("AplanFileHandlerTest")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    try:
+        logger.info("B_%s = %d;", "x", 1)
+        logger.info("END")
+        handler.flush()
+        assert (tmp_path / "out.act").read_text(encoding="utf-8") == "B_x = 1;\nEND\n"
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_log_file_handlers_share_run_timestamp(tmp_path):
+    """
+    Test that file handlers created in one run use the manager's timestamp.
+    """
+    first = LogFileHandler(str(tmp_path / "first.log"))
+    second = LogFileHandler(str(tmp_path / "second.log"))
+    try:
+        run_timestamp = LoggerManager().run_timestamp
+        assert first.baseFilename.endswith(f"first_{run_timestamp}.log")
+        assert second.baseFilename.endswith(f"second_{run_timestamp}.log")
+    finally:
+        first.close()
+        second.close()
+
+
+def test_logger_rejects_unknown_color(logger_instance, log_capture):
+    """
+    Test that a colour outside LOG_COLORS is reported instead of silently ignored.
+    """
+    logger_instance.activate()
+    with pytest.raises(ValueError, match="Unknown log color"):
+        logger_instance.info("Test message", color="magenta")
+    logger_instance.info("Test message", color="bold_yellow")
+    assert "Test message" in log_capture.getvalue()
+
+
+def test_loggers_share_console_order():
+    """
+    Test that records of different loggers reach the console in the order
+    they were logged, and that flush drains all of them.
+    """
+    stream = StringIO()
+    loggers = [Logger("OrderTestA"), Logger("OrderTestB")]
+    for logger in loggers:
+        for handler in logger.logger.handlers:
+            handler.console_handler.setStream(stream)
+            handler.console_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    for i in range(200):
+        loggers[i % 2].info("record %d", i)
+    loggers[0].flush()
+
+    assert stream.getvalue().splitlines() == [f"record {i}" for i in range(200)]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_logger_writes_and_flushes_in_forked_child(tmp_path):
+    """
+    Test that a forked child, which has no listener thread, still writes its
+    records and that flush does not block there.
+    """
+    logger = Logger("ForkTest")
+    output = tmp_path / "child.log"
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        try:
+            with open(output, "w", encoding="utf-8") as stream:
+                for handler in logger.logger.handlers:
+                    handler.console_handler.setStream(stream)
+                    handler.console_handler.setFormatter(
+                        logging.Formatter("%(message)s")
+                    )
+                logger.info("from child")
+                logger.flush()
+        finally:
+            os._exit(0)
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        finished, _ = os.waitpid(pid, os.WNOHANG)
+        if finished:
+            break
+        time.sleep(0.01)
+    else:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        pytest.fail("forked child hung in Logger.flush()")
+
+    assert output.read_text(encoding="utf-8") == "from child\n"
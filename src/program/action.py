@@ -9,17 +9,15 @@ def create_Action_File(self: "Program"):
     # ----------------------------------
     # Actions
     # ----------------------------------
-    actions = ""
-    for index, design_unit in enumerate(
-        self.design_units.getElementsIE(
+    action_strings = (
+        design_unit.actions.getActionsInStrFormat()
+        for design_unit in self.design_units.getElementsIE(
             exclude=ElementsTypes.OBJECT_ELEMENT
         ).getElements()
-    ):
-        result = design_unit.actions.getActionsInStrFormat()
-        if index != 0:
-            if len(result) > 0:
-                actions += ",\n"
-        actions += result
-
-    self.write_to_file(self.path_to_result + "project.act", actions)
-    self.logger.info(".act file created \n", "purple")
+    )
+    self.write_joined_to_file(
+        self.path_to_result + "project.act",
+        (result for result in action_strings if result),
+        ",\n",
+    )
+    self.logger.info(".act file created \n", color="purple")
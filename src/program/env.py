@@ -9,12 +9,12 @@ if TYPE_CHECKING:
 
 
 def create_ENV_File(self: "Program"):
-    env = "environment (\n"  # Open env
+    env = ["environment (\n"]  # Open env
 
     # ----------------------------------
     # Types
     # ----------------------------------
-    env += "\ttypes : obj (\n"
+    env.append("\ttypes : obj (\n")
     sub_env = ""
     decls = self.typedefs.getElementsIE()
 
@@ -23,68 +23,67 @@ def create_ENV_File(self: "Program"):
 
     sub_env += str(decls)
     if len(sub_env) > 0:
-        env += sub_env + "\n"
+        env.append(sub_env + "\n")
     else:
-        env += "\t\t\tNil\n"
-    env += "\t);\n"
+        env.append("\t\t\tNil\n")
+    env.append("\t);\n")
 
     # ----------------------------------
     # Attributes
     # ----------------------------------
 
-    env += "\tattributes : obj (Nil);\n"
+    env.append("\tattributes : obj (Nil);\n")
 
     # ----------------------------------
     # Agents types
     # ----------------------------------
 
-    env += "\tagent_types : obj (\n"
+    env.append("\tagent_types : obj (\n")
 
     for design_unit in self.design_units.getElementsIE(
         exclude=ElementsTypes.OBJECT_ELEMENT
     ).getElements():
-        env += "\t\t{0} : obj (\n".format(design_unit.ident_uniq_name_upper)
-        sub_env = ""
+        env.append(f"\t\t{design_unit.ident_uniq_name_upper} : obj (\n")
         decls = design_unit.declarations.getElementsIE(
             data_type_exclude=DeclTypes.ENUM_TYPE
         )
-        for index, elem in enumerate(decls.getElements()):
-            if index > 0:
-                sub_env += ",\n"
-            sub_env += "\t\t\t{0}:{1}".format(elem.getName(), elem.getAplanDecltype())
-            if index + 1 == len(decls):
-                sub_env += "\n"
+        sub_env = ",\n".join(
+            [
+                f"\t\t\t{elem.getName()}:{elem.getAplanDecltype()}"
+                for elem in decls.getElements()
+            ]
+        )
         if len(sub_env) > 0:
-            env += sub_env
+            env.append(sub_env + "\n")
         else:
-            env += "\t\t\tNil\n"
-        env += "\t\t),\n"
-    env += "\t\tENVIRONMENT:obj(Nil)\n"
-    env += "\t);\n"
+            env.append("\t\t\tNil\n")
+        env.append("\t\t),\n")
+    env.append("\t\tENVIRONMENT:obj(Nil)\n")
+    env.append("\t);\n")
 
     # ----------------------------------
     # Agents
     # ----------------------------------
-    env += "\tagents : obj (\n"
-    for design_unit in self.design_units.getElementsIE(
-        exclude=ElementsTypes.CLASS_ELEMENT
-    ).getElements():
-        env += "\t\t{0} : obj ({1}),\n".format(
-            design_unit.ident_uniq_name_upper, design_unit.ident_uniq_name
-        )
-    env += "\t\tENVIRONMENT : obj (env)\n"
-    env += "\t);\n"
+    env.append("\tagents : obj (\n")
+    env.extend(
+        f"\t\t{design_unit.ident_uniq_name_upper} : obj ({design_unit.ident_uniq_name}),\n"
+        for design_unit in self.design_units.getElementsIE(
+            exclude=ElementsTypes.CLASS_ELEMENT
+        ).getElements()
+    )
+    env.append("\t\tENVIRONMENT : obj (env)\n")
+    env.append("\t);\n")
 
     # ----------------------------------
     # Axioms
     # ----------------------------------
-    env += "\taxioms : obj (Nil);\n"
+    env.append("\taxioms : obj (Nil);\n")
 
     # ----------------------------------
     # Logic formula
     # ----------------------------------
-    env += "\tlogic_formula : obj (1)\n"
-    env += ");"  # Close env
+    env.append("\tlogic_formula : obj (1)\n")
+    env.append(");")  # Close env
 
-    self.write_to_file(self.path_to_result + "project.env_descript", env)
-    self.logger.info(".env_descript file created \n", "purple")
+    self.write_to_file(self.path_to_result + "project.env_descript", "".join(env))
+    self.logger.info(".env_descript file created \n", color="purple")
@@ -11,6 +11,9 @@ from ..classes.design_unit import DesignUnitArray
 from ..classes.design_unit_call import DesignUnitCallArray
 import os
 
+# Result files are generated in memory and written in one go.
+_RESULT_FILE_BUFFER_SIZE = 1 << 20
+
 
 class Program(metaclass=SingletonMeta):
     str_formater = StringFormater()
@@ -49,16 +52,36 @@ class Program(metaclass=SingletonMeta):
             self.path_to_result = "results" + os.sep
 
         self.logger.info(
-            'Path to result: "{0}"\n'.format(self.path_to_result), "bold_yellow"
+            'Path to result: "%s"\n', self.path_to_result, color="bold_yellow"
         )
 
-        if not os.path.exists(self.path_to_result[:-1]):
-            os.mkdir(self.path_to_result[:-1])
+        os.makedirs(self.path_to_result, exist_ok=True)
 
     def write_to_file(self, path, data):
-        f = open(path, "w")
-        f.write(data)
-        f.close()
+        # The whole file content is already in memory: write it through one
+        # large buffer so it reaches the OS in as few syscalls as possible.
+        with open(path, "w", encoding="utf-8", buffering=_RESULT_FILE_BUFFER_SIZE) as f:
+            f.write(data)
+
+    def write_joined_to_file(self, path, parts, separator=""):
+        """
+        Writes `separator.join(parts)` to `path` without building the joined
+        string: each part is written as soon as it is produced.
+
+        Args:
+            path: Path of the result file.
+            parts: Iterable (typically a generator) of strings.
+            separator: String written between consecutive parts.
+        """
+        with open(path, "w", encoding="utf-8", buffering=_RESULT_FILE_BUFFER_SIZE) as f:
+            write = f.write
+            parts = iter(parts)
+            for part in parts:
+                write(part)
+                break
+            for part in parts:
+                write(separator)
+                write(part)
 
     def create_aplan_files(self):
         create_EVT_File(self)
@@ -66,6 +89,6 @@ class Program(metaclass=SingletonMeta):
         create_Action_File(self)
         create_Beh_File(self)
         self.logger.info(
-            "The translation was successfully completed! \n", "bold_yellow"
+            "The translation was successfully completed! \n", color="bold_yellow"
         )
         self.counters.deinit()
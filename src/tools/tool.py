@@ -1,4 +1,9 @@
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import logging
+import multiprocessing
 import os
+import string
 import sys
 import time
 import traceback
@@ -9,12 +14,50 @@ from ..program.program import Program
 from ..utils.time import TimeUtils
 
 
+@functools.lru_cache(maxsize=128)
+def _percent_template(template: str):
+    """
+    Перетворює шаблон str.format з іменованими полями (`"Time: {time_str}"`)
+    на %-шаблон для логера (`"Time: %(time_str)s"`), щоб текст форматувався
+    лише тоді, коли запис справді виводиться. Повертає None, якщо шаблон
+    використовує специфікатори формату чи складні поля.
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        parts.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            return None
+        parts.append(f"%({field})s")
+    return "".join(parts)
+
+
+# Tools created in a worker process, reused for every example it runs.
+_WORKER_TOOLS: dict = {}
+
+
+def _run_example_in_worker(
+    tool_class, tool_name: str, tool_type: str, method_name: str, item_number, data
+) -> bool:
+    """Runs one example of `_execute_examples_loop` in a worker process."""
+    key = (tool_class, tool_name, tool_type)
+    tool = _WORKER_TOOLS.get(key)
+    if tool is None:
+        tool = _WORKER_TOOLS[key] = tool_class(tool_name)
+        tool.setType(tool_type)
+    return getattr(tool, method_name)(item_number, data)
+
+
 class BaseTool:
     # --- Конфігурація логування та повідомлень ---
     time_utils = TimeUtils()
     file_manager = FilesMngr()
     name = ""
     _type = None
+    # Case-normalised copies of `_type`, refreshed by `setType`.
+    _type_lower = None
+    _type_upper = None
 
     # Константи для кольорів логування
     LOG_DELIMITER_COLOR_MAIN = "cyan"
@@ -23,7 +66,7 @@ class BaseTool:
     LOG_INFO_COLOR_TIME = "green"
     LOG_INFO_COLOR_SOURCE_FILE = "blue"
 
-    # Константи для повідомлень
+    # Константи для повідомлень (шаблони str.format; для логера див. `_log_template`)
     MSG_TOOL_START = "{tool_name} START"
     MSG_MAIN_PROGRAM = "MAIN PROGRAM"
     MSG_PROGRAM_START_TIME = "Program start time: {time_str}"
@@ -66,39 +109,128 @@ class BaseTool:
 
     def __init__(self, name: str = "Tool"):
         self.name = name
+        self._name_upper = name.upper()
+        # Built from MSG_TOOL_START on first use, see `_tool_start_message`.
+        self._msg_tool_start = None
         self.logger: Logger = LoggerManager().getLogger(self.__class__.__qualname__)
         self.translation_mngr = BaseTranslationManager()
+        self._reported_exceptions: set = set()
+
+    def _tool_start_message(self) -> str:
+        """
+        Повертає текст MSG_TOOL_START для цього інструмента, обчислений один раз.
+        Приймає шаблон `{tool_name}` і, для сумісності, `%s`.
+
+        Raises:
+            ValueError: Якщо шаблон використовує інші поля.
+        """
+        message = self._msg_tool_start
+        if message is None:
+            template = self.MSG_TOOL_START
+            try:
+                message = template.format(tool_name=self._name_upper)
+            except (KeyError, IndexError, ValueError) as e:
+                raise ValueError(
+                    f"{type(self).__name__}.MSG_TOOL_START {template!r} must use "
+                    "the {tool_name} placeholder."
+                ) from e
+            if message == template and "%s" in template:
+                message = template % self._name_upper
+            self._msg_tool_start = message
+        return message
+
+    def _log_template(self, log, template: str, color=None, **fields):
+        """
+        Логує публічний шаблон MSG_* через `log` (напр. `self.logger.info`).
+        Поля підставляються лише якщо запис виводиться.
+        """
+        lazy_template = _percent_template(template)
+        if lazy_template is None:
+            log(template.format(**fields), color=color)
+        else:
+            log(lazy_template, fields, color=color)
 
     def setType(self, i_type: str):
         """Встановлює тип для транслятора."""
         self._type = i_type
+        self._type_lower = i_type.lower()
+        self._type_upper = i_type.upper()
 
     def _log_time_summary(
-        self, start_time: float, process_name: str, is_start_log: bool = False
+        self,
+        start_time: float,
+        process_name: str,
+        is_start_log: bool = False,
+        perf_start: float = None,
     ):
-        """Допоміжний метод для логування часу початку, кінця та виконання процесу."""
+        """
+        Допоміжний метод для логування часу початку, кінця та виконання процесу.
+
+        `start_time` is the wall-clock start used for display; when the
+        matching `time.perf_counter()` reading is passed as `perf_start`, the
+        execution time is measured with the monotonic clock instead.
+        """
+        if not self.logger.info_enabled:
+            return
+
         current_time = time.time()
-        execution_time = current_time - start_time
+        if perf_start is None:
+            execution_time = current_time - start_time
+        else:
+            execution_time = time.perf_counter() - perf_start
 
         if is_start_log:
             self.logger.info(
-                f"{process_name} start time: {self.time_utils.format_time_h_m_s(start_time)}",
+                "%s start time: %s",
+                process_name,
+                self.time_utils.format_time_h_m_s(start_time),
                 color=self.LOG_INFO_COLOR_TIME,
             )
         else:
             self.logger.info(
-                f"{process_name} end time: {self.time_utils.format_time_m_s(current_time)}",
+                "%s end time: %s",
+                process_name,
+                self.time_utils.format_time_m_s(current_time),
                 color=self.LOG_INFO_COLOR_TIME,
             )
             self.logger.info(
-                f"{process_name} execution time: {self.time_utils.format_time_date_h_m_s(execution_time)}",
+                "%s execution time: %s",
+                process_name,
+                self.time_utils.format_time_date_h_m_s(execution_time),
                 color=self.LOG_INFO_COLOR_TIME,
             )
 
     def _handle_exception(self, e: Exception, message: str):
-        """Допоміжний метод для обробки винятків та логування."""
+        """
+        Допоміжний метод для обробки винятків та логування.
+
+        The traceback is skipped while ERROR records are filtered, and an
+        exception already reported from the same place (e.g. the same failure
+        across many examples) is summarised in one line instead.
+        """
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         self.logger.error(message)
-        traceback.print_exception(type(e), e, e.__traceback__, file=sys.stderr)
+
+        tb = e.__traceback__
+        if tb is not None:
+            while tb.tb_next is not None:
+                tb = tb.tb_next
+            origin = (tb.tb_frame.f_code.co_filename, tb.tb_lineno)
+        else:
+            origin = None
+        key = (type(e), str(e), origin)
+        if key in self._reported_exceptions:
+            self.logger.error("%s: %s (traceback already shown)", type(e).__name__, e)
+            return
+        self._reported_exceptions.add(key)
+
+        # Console records are written asynchronously; drain them so the
+        # traceback is printed after the error message.
+        self.logger.flush()
+        # One write for the whole traceback instead of one per line.
+        sys.stderr.write("".join(traceback.format_exception(e)))
+        sys.stderr.flush()
 
     def start(self, path: str, path_to_aplan_result: str) -> bool:
         """
@@ -110,29 +242,32 @@ class BaseTool:
             return True  # Повертаємо True, оскільки це помилка
 
         self.logger.delimetr(
-            text=self.MSG_TOOL_START.format(tool_name=self.name.upper()),
+            text=self._tool_start_message(),
             color=self.LOG_DELIMITER_COLOR_MAIN,
         )
         start_time = time.time()
-        self.logger.info(
-            self.MSG_PROGRAM_START_TIME.format(
-                time_str=self.time_utils.format_time_h_m_s(start_time)
-            ),
-            color=self.LOG_INFO_COLOR_TIME,
-        )
+        perf_start = time.perf_counter()
+        if self.logger.info_enabled:
+            self._log_template(
+                self.logger.info,
+                self.MSG_PROGRAM_START_TIME,
+                color=self.LOG_INFO_COLOR_TIME,
+                time_str=self.time_utils.format_time_h_m_s(start_time),
+            )
         self.logger.delimetr(
             text=self.MSG_MAIN_PROGRAM,
             color=self.LOG_DELIMITER_COLOR_MAIN,
         )
 
         try:
-            program = Program(path_to_aplan_result)
-            program.path_to_result = path_to_aplan_result
-
-            if self.file_manager.is_testing_file(path, self._type.lower()):
+            if self.file_manager.is_testing_file(path, self._type_lower):
                 self.translation_mngr.setup(path)
                 self.translation_mngr.translate()
 
+            # Program is a singleton: only the first call uses the argument,
+            # so the result path is assigned explicitly for every run.
+            program = Program(path_to_aplan_result)
+            program.path_to_result = path_to_aplan_result
             program.create_result_dirrectory()
             program.create_aplan_files()
             return False  # Успішне виконання
@@ -141,26 +276,27 @@ class BaseTool:
             return True  # Помилка
         finally:
             self.logger.delimetr(color=self.LOG_DELIMITER_COLOR_MAIN)
-            end_time = time.time()
-            execution_time = end_time - start_time
-            self.logger.info(
-                self.MSG_PROGRAM_END_TIME.format(
-                    time_str=self.time_utils.format_time_date_h_m_s(end_time)
-                ),
-                color=self.LOG_INFO_COLOR_TIME,
-            )
-            self.logger.info(
-                self.MSG_PROGRAM_EXECUTION_TIME.format(
-                    time_str=self.time_utils.format_time_m_s(execution_time)
-                ),
-                color=self.LOG_INFO_COLOR_TIME,
-            )
-            self.logger.delimetr(
-                text=self.MSG_TOOL_END.format(
-                    tool_type=self._type.upper(), tool_name=self.name.upper()
-                ),
-                color=self.LOG_DELIMITER_COLOR_MAIN,
-            )
+            if self.logger.info_enabled:
+                end_time = time.time()
+                execution_time = time.perf_counter() - perf_start
+                self._log_template(
+                    self.logger.info,
+                    self.MSG_PROGRAM_END_TIME,
+                    color=self.LOG_INFO_COLOR_TIME,
+                    time_str=self.time_utils.format_time_date_h_m_s(end_time),
+                )
+                self._log_template(
+                    self.logger.info,
+                    self.MSG_PROGRAM_EXECUTION_TIME,
+                    color=self.LOG_INFO_COLOR_TIME,
+                    time_str=self.time_utils.format_time_m_s(execution_time),
+                )
+                self.logger.delimetr(
+                    text=self.MSG_TOOL_END.format(
+                        tool_type=self._type_upper, tool_name=self._name_upper
+                    ),
+                    color=self.LOG_DELIMITER_COLOR_MAIN,
+                )
 
     def _execute_single_operation(
         self,
@@ -179,12 +315,14 @@ class BaseTool:
             text=f"{operation_type.upper()} {item_number}",
             color=self.LOG_DELIMITER_COLOR_TEST,
         )
-        op_start_time = time.time()
+        op_start_time = time.perf_counter()
 
         try:
-            self.logger.info(
-                self.MSG_SOURCE_FILE.format(file_path=source_file),
+            self._log_template(
+                self.logger.info,
+                self.MSG_SOURCE_FILE,
                 color=self.LOG_INFO_COLOR_SOURCE_FILE,
+                file_path=source_file,
             )
             self.logger.activate()
             # Основна логіка: виклик start()
@@ -194,16 +332,20 @@ class BaseTool:
 
             if operation_type == "TEST":
                 if has_error:
-                    self.logger.error(
-                        self.MSG_TEST_ERROR_FINISHED.format(test_number=item_number)
+                    self._log_template(
+                        self.logger.error,
+                        self.MSG_TEST_ERROR_FINISHED,
+                        test_number=item_number,
                     )
 
                 differences_found = self.file_manager.compareAplanByPathes(
                     aplan_code_path, result_path
                 )
                 if differences_found:
-                    self.logger.error(
-                        self.MSG_TEST_ERROR_DIFFERENCES.format(test_number=item_number)
+                    self._log_template(
+                        self.logger.error,
+                        self.MSG_TEST_ERROR_DIFFERENCES,
+                        test_number=item_number,
                     )
                     has_error = True
 
@@ -216,12 +358,15 @@ class BaseTool:
             if operation_type == "TEST":
                 self.file_manager.remove_directory(result_path)
 
-            op_execution_time = time.time() - op_start_time
-            self.logger.info(
-                f"{operation_type} {item_number} execution time: "
-                + self.time_utils.format_time_date_h_m_s(op_execution_time),
-                color=self.LOG_INFO_COLOR_TIME,
-            )
+            if self.logger.info_enabled:
+                op_execution_time = time.perf_counter() - op_start_time
+                self.logger.info(
+                    "%s %s execution time: %s",
+                    operation_type,
+                    item_number,
+                    self.time_utils.format_time_date_h_m_s(op_execution_time),
+                    color=self.LOG_INFO_COLOR_TIME,
+                )
             self.logger.delimetr(color=self.LOG_DELIMITER_COLOR_MAIN)
 
         return has_error
@@ -243,11 +388,19 @@ class BaseTool:
         )
 
     def _execute_examples_loop(
-        self, examples_list_path: str, process_func, process_name: str
+        self,
+        examples_list_path: str,
+        process_func,
+        process_name: str,
+        workers: int = 1,
     ) -> int:
         """
         Уніфікована логіка для запуску тестів або генерації з файлу прикладів.
         Повертає 0, якщо все успішно, 1, якщо є помилки.
+
+        With `workers` > 1 the examples run in that many spawned processes,
+        each with its own tool instance (and its own singletons); failures
+        are still reported in example order.
         """
         all_examples = self.file_manager.load_examples_from_json(examples_list_path)
         failed_items = []
@@ -261,16 +414,35 @@ class BaseTool:
             ),
         )
         start_time = time.time()
+        perf_start = time.perf_counter()
         self._log_time_summary(
             start_time, f"{process_name.capitalize()}", is_start_log=True
         )
 
-        for item_number, data in enumerate(all_examples):
-            # Передача всіх даних dict'ом до process_func для гнучкості
-            if process_func(item_number + 1, data):
-                failed_items.append((item_number + 1, data.get("file", "N/A")))
+        # Передача всіх даних dict'ом до process_func для гнучкості
+        item_numbers = range(1, len(all_examples) + 1)
+        if workers > 1:
+            run_example = functools.partial(
+                _run_example_in_worker,
+                type(self),
+                self.name,
+                self._type,
+                process_func.__name__,
+            )
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                results = list(executor.map(run_example, item_numbers, all_examples))
+        else:
+            results = map(process_func, item_numbers, all_examples)
+
+        for item_number, data, failed in zip(item_numbers, all_examples, results):
+            if failed:
+                failed_items.append((item_number, data.get("file", "N/A")))
 
-        self._log_time_summary(start_time, f"{process_name.capitalize()}")
+        self._log_time_summary(
+            start_time, f"{process_name.capitalize()}", perf_start=perf_start
+        )
 
         if not failed_items:
             self.logger.delimetr(
@@ -283,7 +455,9 @@ class BaseTool:
                 text=f"{process_name.upper()} FAILED",
                 color=self.LOG_DELIMITER_COLOR_ERROR,
             )
-            self.logger.critical(f"Errors in {process_name.lower()}: {failed_items}\n")
+            self.logger.critical(
+                "Errors in %s: %s\n", process_name.lower(), failed_items
+            )
             return 1
 
     def _run_single_test_wrapper(self, test_number: int, data: dict) -> bool:
@@ -299,14 +473,17 @@ class BaseTool:
         result_path = data["aplan_dir"]  # У генерації aplan_dir є результатом
         return self.run_generation(gen_number, source_file, result_path)
 
-    def tests_start(self, examples_list_path: str) -> int:
+    def tests_start(self, examples_list_path: str, workers: int = 1) -> int:
         """Запускає серію тестів на основі файлу прикладів."""
         return self._execute_examples_loop(
-            examples_list_path, self._run_single_test_wrapper, "TESTS"
+            examples_list_path, self._run_single_test_wrapper, "TESTS", workers
         )
 
     def regeneration_start(
-        self, examples_list_path: str = None, path_to_vhdl: str = None
+        self,
+        examples_list_path: str = None,
+        path_to_vhdl: str = None,
+        workers: int = 1,
     ) -> int:
         """
         Запускає процес генерації коду: або для всіх прикладів з файлу, або для одного SV-файлу.
@@ -318,7 +495,10 @@ class BaseTool:
 
         if path_to_vhdl is None:
             return self._execute_examples_loop(
-                examples_list_path, self._run_single_generation_wrapper, "GENERATION"
+                examples_list_path,
+                self._run_single_generation_wrapper,
+                "GENERATION",
+                workers,
             )
         else:
 
@@ -334,31 +514,36 @@ class BaseTool:
                 color=self.LOG_DELIMITER_COLOR_TEST,
             )
             start_time = time.time()
-            self.logger.info(
-                self.MSG_GENERATION_PROCESS_START_TIME.format(
-                    time_str=self.time_utils.format_time_h_m_s(start_time)
-                ),
+            perf_start = time.perf_counter()
+            self._log_template(
+                self.logger.info,
+                self.MSG_GENERATION_PROCESS_START_TIME,
                 color=self.LOG_INFO_COLOR_TIME,
+                time_str=self.time_utils.format_time_h_m_s(start_time),
             )
 
             has_error = self.run_generation(
                 1, source_file, result_path
             )  # Для одного файлу використовуємо номер 1
 
-            self._log_time_summary(start_time, "Single Generation Process")
+            self._log_time_summary(
+                start_time, "Single Generation Process", perf_start=perf_start
+            )
 
             if has_error:
                 self.logger.delimetr(
-                    self.MSG_SINGLE_GENERATION_FAILED,
+                    text=self.MSG_SINGLE_GENERATION_FAILED,
                     color=self.LOG_DELIMITER_COLOR_ERROR,
                 )
-                self.logger.critical(
-                    self.MSG_ERRORS_IN_SINGLE_GENERATION.format(file_path=source_file)
+                self._log_template(
+                    self.logger.critical,
+                    self.MSG_ERRORS_IN_SINGLE_GENERATION,
+                    file_path=source_file,
                 )
                 return 1
             else:
                 self.logger.delimetr(
-                    self.MSG_SINGLE_GENERATION_SUCCESS,
+                    text=self.MSG_SINGLE_GENERATION_SUCCESS,
                     color=self.LOG_DELIMITER_COLOR_TEST,
                 )
                 return 0
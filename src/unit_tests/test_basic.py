@@ -0,0 +1,334 @@
+import copy
+import pytest
+from ..classes.basic import Basic, BasicArray
+from ..classes.element_types import ElementsTypes
+
+
+@pytest.fixture
+def array():
+    array = BasicArray(Basic)
+    for identifier in ("a", "b", "c"):
+        array.addElement(Basic(identifier))
+    return array
+
+
+# ---------------------------
+# Tests for getElement / getElementIndex
+# ---------------------------
+def test_getElement_found_and_missing(array):
+    """
+    Test that getElement returns the element with the identifier, or None.
+    """
+    assert array.getElement("b") is array.elements[1]
+    assert array.getElement("z") is None
+
+
+def test_getElementIndex_first_occurrence(array):
+    """
+    Test that getElementIndex returns the first index for duplicate identifiers.
+    """
+    array.addElement(Basic("a"))
+    assert array.getElementIndex("a") == 0
+    assert array.getElementIndex("c") == 2
+
+
+def test_getElementIndex_after_direct_append(array):
+    """
+    Test that elements appended straight to `elements` are found.
+    """
+    array.getElementIndex("a")
+    array.elements.append(Basic("d"))
+    assert array.getElementIndex("d") == 3
+
+
+def test_getElementIndex_after_structural_changes(array):
+    """
+    Test that insert, removal and reverse keep lookups consistent.
+    """
+    array.getElementIndex("a")
+    array.insert(0, Basic("z"))
+    assert array.getElementIndex("a") == 1
+    array.removeElementByIndex(0)
+    assert array.getElementIndex("z") is None
+    array.removeElement(array.getElement("b"))
+    assert array.getElementIndex("c") == 1
+    array.reverse()
+    assert array.getElementIndex("c") == 0
+
+
+def test_getElementIndex_after_in_place_sort(array):
+    """
+    Test that an in-place reorder of `elements` is detected on lookup.
+    """
+    array.getElementIndex("a")
+    array.elements.sort(key=lambda element: element.identifier, reverse=True)
+    assert array.getElementIndex("a") == 2
+
+
+def test_getElementIndex_after_direct_pop_and_append(array):
+    """
+    Test that replacing the last element without changing the length is detected.
+    """
+    array.getElementIndex("a")
+    array.elements.pop()
+    array.elements.append(Basic("z"))
+    assert array.getElementIndex("z") == 2
+    assert "z" in array
+    assert array.getElementIndex("c") is None
+
+    array.getElementIndex("a")
+    array.elements.pop()
+    array.elements.extend([Basic("y"), Basic("x")])
+    assert array.getElementIndex("y") == 2
+    assert array.getElementIndex("x") == 3
+
+
+def test_getElementIndex_after_pop_append_and_remove_last(array):
+    """
+    Test that removing the last element does not hide an earlier direct swap.
+    """
+    array.getElementIndex("a")
+    array.elements.pop()
+    array.elements.append(Basic("z"))
+    array.elements.append(Basic("w"))
+    array.removeElementByIndex(3)
+    assert array.getElementIndex("z") == 2
+
+
+def test_getElement_after_direct_identifier_assignment(array):
+    """
+    Test that an element renamed by assigning `identifier` is found.
+    """
+    array.getElementIndex("a")
+    element = array.elements[1]
+    element.identifier = "k"
+    assert array.getElement("k") is element
+    assert array.getElement("b") is None
+
+
+def test_getElement_after_mid_list_replacement(array):
+    """
+    Test that an element put into the middle of `elements` is found.
+    """
+    array.getElementIndex("a")
+    replacement = Basic("k")
+    array.elements[0] = replacement
+    assert array.getElement("k") is replacement
+    assert array.getElementIndex("k") == 0
+    assert "k" in array
+    assert array.getElement("a") is None
+
+
+def test_getElement_after_rename(array):
+    """
+    Test that a renamed element is found under its new identifier.
+    """
+    array.getElementIndex("a")
+    array.elements[0].changeIdentifier("renamed")
+    assert array.getElement("renamed") is array.elements[0]
+    assert array.getElement("a") is None
+
+
+# ---------------------------
+# Tests for getElementsIE
+# ---------------------------
+def test_getElementsIE_filters(array):
+    """
+    Test that getElementsIE applies identifier and type filters.
+    """
+    array.addElement(Basic("d", element_type=ElementsTypes.LOOP_ELEMENT))
+    assert [e.identifier for e in array.getElementsIE(exclude_identifier="b")] == [
+        "a",
+        "c",
+        "d",
+    ]
+    assert [
+        e.identifier for e in array.getElementsIE(include=ElementsTypes.LOOP_ELEMENT)
+    ] == ["d"]
+
+
+# ---------------------------
+# Tests for copy / deepcopy
+# ---------------------------
+def test_copy_is_independent(array):
+    """
+    Test that copy() duplicates elements and keeps lookups working.
+    """
+    array.getElementIndex("a")
+    new_array = array.copy()
+    assert [e.identifier for e in new_array] == ["a", "b", "c"]
+    assert new_array.elements[0] is not array.elements[0]
+    assert new_array.getElement("c") is new_array.elements[2]
+    new_array.addElement(Basic("d"))
+    assert array.getElement("d") is None
+
+
+def test_deepcopy_preserves_shared_elements():
+    """
+    Test that deepcopy keeps one copy for an element stored twice.
+    """
+    shared = Basic("x")
+    array = BasicArray(Basic)
+    array.addElement(shared)
+    array.addElement(shared)
+    new_array = copy.deepcopy(array)
+    assert new_array.elements[0] is new_array.elements[1]
+    assert new_array.elements[0] is not shared
+    assert new_array.elements[0].sequence == shared.sequence
+
+
+def test_basic_uses_slots():
+    """
+    Test that plain Basic instances have no per-instance __dict__.
+    """
+    assert not hasattr(Basic("a"), "__dict__")
+
+
+def test_getElementsIE_combined_filters(array):
+    """
+    Test that several filters are applied together.
+    """
+    array.addElement(Basic("a", element_type=ElementsTypes.LOOP_ELEMENT))
+    result = array.getElementsIE(
+        include=ElementsTypes.LOOP_ELEMENT, include_identifier="a"
+    )
+    assert len(result) == 1
+    assert result.elements[0].element_type is ElementsTypes.LOOP_ELEMENT
+    assert len(array.getElementsIE(exclude=ElementsTypes.NONE_ELEMENT)) == 1
+
+
+# ---------------------------
+# Tests for checkSourceInteval
+# ---------------------------
+def test_checkSourceInteval_sorted_index():
+    """
+    Test that the interval check finds containing intervals and follows
+    appends, removals and interval changes.
+    """
+    array = BasicArray(Basic)
+    array.addElement(Basic("a", (10, 20)))
+    array.addElement(Basic("b", (0, 5)))
+    assert array.checkSourceInteval((12, 18)) is False
+    assert array.checkSourceInteval((2, 5)) is False
+    assert array.checkSourceInteval((4, 12)) is True
+    assert array.checkSourceInteval((30, 40)) is True
+
+    array.elements.append(Basic("c", (25, 50)))
+    assert array.checkSourceInteval((30, 40)) is False
+
+    array.removeElementByIndex(0)
+    assert array.checkSourceInteval((12, 18)) is True
+
+
+def _linearCheckSourceInteval(array, source_interval):
+    """The original linear scan that checkSourceInteval must agree with."""
+    for element in array.elements:
+        start, end = element.source_interval
+        if source_interval[0] >= start and source_interval[1] <= end:
+            return False
+    return True
+
+
+QUERIES = [(10, 20), (0, 5), (2, 3), (50, 60), (55, 58), (0, 100)]
+
+
+def test_checkSourceInteval_after_pop_and_addElement():
+    """
+    Test that replacing the last element via pop() and addElement, as
+    DeclTypeArray.removeLastElement does, matches the linear scan.
+    """
+    array = BasicArray(Basic)
+    array.addElement(Basic("p", (0, 100)))
+    assert array.checkSourceInteval((10, 20)) is False
+    array.elements.pop()
+    array.addElement(Basic("q", (0, 5)))
+    for query in QUERIES:
+        assert array.checkSourceInteval(query) is _linearCheckSourceInteval(
+            array, query
+        )
+    assert array.checkSourceInteval((10, 20)) is True
+
+
+def test_checkSourceInteval_after_direct_interval_assignment():
+    """
+    Test that assigning `source_interval` on a stored element matches the
+    linear scan.
+    """
+    array = BasicArray(Basic)
+    z = Basic("z", (0, 5))
+    array.addElement(z)
+    array.addElement(Basic("y", (10, 20)))
+    assert array.checkSourceInteval((50, 60)) is True
+    z.source_interval = (50, 60)
+    for query in QUERIES:
+        assert array.checkSourceInteval(query) is _linearCheckSourceInteval(
+            array, query
+        )
+    assert array.checkSourceInteval((55, 58)) is False
+
+
+def test_getName_cache_follows_changes():
+    """
+    Test that getName reflects identifier and number changes after caching.
+    """
+    element = Basic("a")
+    assert element.getName() == "a"
+    element.number = 3
+    assert element.getName() == "a_3"
+    element.changeIdentifier("b")
+    assert element.getName() == "b_3"
+    element.number = None
+    assert element.getName() == "b"
+
+
+def test_extend_and_iadd(array):
+    """
+    Test that extend and += append in order and keep lookups working.
+    """
+    array.extend(Basic(identifier) for identifier in ("d", "e"))
+    assert array.getElementIndex("e") == 4
+
+    other = BasicArray(Basic)
+    other.addElement(Basic("f"))
+    array += other
+    assert [element.identifier for element in array] == ["a", "b", "c", "d", "e", "f"]
+    assert array.getElementIndex("f") == 5
+
+
+def test_identifiers_are_interned():
+    """
+    Test that identifiers built at runtime are interned.
+    """
+    first = Basic("".join(["sig", "nal"]))
+    second = Basic("".join(["si", "gnal"]))
+    assert first.identifier is second.identifier
+
+
+def test_removeElement_keeps_lookups_consistent(array):
+    """
+    Test removing the last and a middle element, including one with a
+    duplicated identifier.
+    """
+    duplicate = Basic("a", (5, 9))
+    array.addElement(duplicate)
+    assert array.checkSourceInteval((6, 7)) is False
+
+    array.removeElement(duplicate)
+    assert array.getElementIndex("a") == 0
+    assert array.checkSourceInteval((6, 7)) is True
+
+    array.removeElement(array.getElement("b"))
+    assert [element.identifier for element in array] == ["a", "c"]
+    assert array.getElementIndex("c") == 1
+
+
+def test_bool_and_contains(array):
+    """
+    Test truthiness and membership by identifier and by element.
+    """
+    assert array
+    assert not BasicArray(Basic)
+    assert "b" in array
+    assert "z" not in array
+    assert array.getElement("c") in array
+    assert Basic("c") not in array
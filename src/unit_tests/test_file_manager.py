@@ -147,6 +147,31 @@ class TestCompareAplanByPathes:
         assert result is True
         assert "differences" in caplog.text
 
+    def test_missing_file_and_directory(self, file_manager, tmp_path, caplog):
+        """
+        Test that files missing from the second path are reported and that a
+        missing directory is treated as empty.
+        """
+        dir1 = tmp_path / "dir1"
+        dir1.mkdir()
+        (dir1 / "test.act").write_text("aaa\n")
+        (dir1 / "test.behp").write_text("bbb\n")
+        (dir1 / "nested.act").mkdir()
+
+        result = file_manager.compareAplanByPathes(
+            str(dir1), str(tmp_path / "missing"), [".act"]
+        )
+        assert result is False
+        assert "test.act not found" in caplog.text
+        assert "test.behp" not in caplog.text
+        assert "nested.act" not in caplog.text
+        assert (
+            file_manager.compareAplanByPathes(
+                str(tmp_path / "missing"), str(dir1), [".act"]
+            )
+            is False
+        )
+
 
 # ---------------------------
 # Tests for remove_directory
@@ -251,6 +276,42 @@ class TestLoadExamplesFromJson:
             "c",
         ]  # should pass, since only type(list) is checked
 
+    def test_repeated_load_is_cached(self, file_manager, tmp_path):
+        """
+        Test that an unchanged file is parsed only once.
+        """
+        f = tmp_path / "cached.json"
+        f.write_text(json.dumps([{"a": "1"}]))
+        with patch("json.load", wraps=json.load) as load:
+            first = file_manager.load_examples_from_json(str(f))
+            second = file_manager.load_examples_from_json(str(f))
+        assert first == second == [{"a": "1"}]
+        assert first is not second
+        assert load.call_count == 1
+
+    def test_cached_entries_are_not_shared(self, file_manager, tmp_path):
+        """
+        Test that editing a loaded example does not change later loads.
+        """
+        f = tmp_path / "shared.json"
+        f.write_text(json.dumps([{"a": "1", "tags": ["x"]}]))
+        first = file_manager.load_examples_from_json(str(f))
+        first[0]["a"] = "changed"
+        first[0]["tags"].append("y")
+        assert file_manager.load_examples_from_json(str(f)) == [
+            {"a": "1", "tags": ["x"]}
+        ]
+
+    def test_rewritten_file_is_reloaded(self, file_manager, tmp_path):
+        """
+        Test that a rewritten file is parsed again.
+        """
+        f = tmp_path / "rewritten.json"
+        f.write_text(json.dumps([{"a": "1"}]))
+        assert file_manager.load_examples_from_json(str(f)) == [{"a": "1"}]
+        f.write_text(json.dumps([{"a": "1"}, {"b": "22"}]))
+        assert file_manager.load_examples_from_json(str(f)) == [{"a": "1"}, {"b": "22"}]
+
 
 # ---------------------------
 # Tests for replace_filename
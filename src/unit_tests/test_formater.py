@@ -16,6 +16,24 @@ def sf():
     return StringFormater()
 
 
+def test_tokenizeExpression(sf):
+    """
+    Test tokenizeExpression method.
+    Identifiers and numbers stay whole, whitespace is never a token.
+    """
+    assert sf.tokenizeExpression("a_1 + 42*(b)") == [
+        "a_1",
+        "+",
+        "42",
+        "*",
+        "(",
+        "b",
+        ")",
+    ]
+    assert sf.tokenizeExpression("x\n  ==\ty") == ["x", "=", "=", "y"]
+    assert sf.tokenizeExpression("   ") == []
+
+
 def test_remove_trailing_comma(sf):
     """
     Test removeTrailingComma method.
@@ -56,6 +74,31 @@ def test_replaceValueParametrsCalls(sf):
     assert sf.replaceValueParametrsCalls(param_array, "") == ""
 
 
+def test_replaceValueParametrsCalls_single_pass_matches_sequential(sf):
+    """
+    The one-pass substitution for int values should match substituting the
+    parameters one by one: duplicates keep the first value, prefixes of other
+    identifiers are left alone, and non-int values still chain.
+    """
+    param_array = SimpleNamespace(
+        elements=[
+            SimpleNamespace(identifier="WIDTH", value=8),
+            SimpleNamespace(identifier="AB", value=3),
+            SimpleNamespace(identifier="A", value=1),
+            SimpleNamespace(identifier="A", value=2),
+        ]
+    )
+    assert sf.replaceValueParametrsCalls(param_array, "WIDTH-A+AB*A_1") == "8-1+3*A_1"
+
+    chained = SimpleNamespace(
+        elements=[
+            SimpleNamespace(identifier="DEPTH", value="WIDTH*2"),
+            SimpleNamespace(identifier="WIDTH", value=8),
+        ]
+    )
+    assert sf.replaceValueParametrsCalls(chained, "DEPTH+1") == "8*2+1"
+
+
 def test_addSpacesAroundOperators(sf):
     """
     Test addSpacesAroundOperators method.
@@ -65,6 +108,9 @@ def test_addSpacesAroundOperators(sf):
     assert sf.addSpacesAroundOperators("a+b*c==d") == "a + b * c == d"
     assert sf.addSpacesAroundOperators("a>=b") == "a >= b"
     assert sf.addSpacesAroundOperators("") == ""
+    assert sf.addSpacesAroundOperators(" f(a,b ,\n  c) ") == "f ( a, b , c )"
+    assert sf.addSpacesAroundOperators("x1,") == "x1, "
+    assert sf.addSpacesAroundOperators("a, \n") == "a, "
 
 
 def test_valuesToAplanStandart(sf):
@@ -75,6 +121,9 @@ def test_valuesToAplanStandart(sf):
     assert sf.valuesToAplanStandart("4'b1010") == "10"  # binary
     assert sf.valuesToAplanStandart("2'hf") == "15"  # hex
     assert sf.valuesToAplanStandart("'123") == "123"  # decimal
+    assert sf.valuesToAplanStandart("'007") == "7"  # leading zeros
+    assert sf.valuesToAplanStandart("x = 3'b101 + 8'hFF") == "x = 5 + 255"
+    assert sf.valuesToAplanStandart("8'd5") == "8d5"  # stray quote dropped
 
 
 def test_addBracketsAfterNegation(sf):
@@ -156,6 +205,27 @@ def test_notConcreteIndex2AplanStandart_without_dimension(sf):
     )
 
 
+def test_notConcreteIndex2AplanStandart_looks_up_each_name_once(sf):
+    """
+    Test notConcreteIndex2AplanStandart method with repeated indexed names.
+    Each name is looked up in the declarations once per expression.
+    """
+    lookups = []
+
+    def find(name):
+        lookups.append(name)
+        return object() if name == "mem" else None
+
+    mock_decl = SimpleNamespace(findDeclWithDimentionByName=find)
+    mock_design_unit = SimpleNamespace(declarations=mock_decl)
+    expr = "u.mem[i] + u.mem[j] + u.reg[i] + u.reg[k]"
+    assert (
+        sf.notConcreteIndex2AplanStandart(expr, mock_design_unit)
+        == "u.mem(i) + u.mem(j) + BGET(u.reg, i) + BGET(u.reg, k)"
+    )
+    assert lookups == ["mem", "reg"]
+
+
 def test_vectorSizes2AplanStandart_single(sf):
     """
     Test vectorSizes2AplanStandart method for single index.
@@ -199,4 +269,8 @@ def test_replace_cpp_operators(sf):
     assert sf.replace_cpp_operators("x++") == "x += 1"
 
     assert sf.replace_cpp_operators("x&&y||!z") == "x and y or not z"
+    assert sf.replace_cpp_operators("a && !b") == "a and not b"
+    # Booleans are replaced as whole words only.
+    assert sf.replace_cpp_operators("untrue || false_path") == "untrue or false_path"
+    assert sf.replace_cpp_operators("(true)&&x") == "(True) and x"
     assert sf.replace_cpp_operators("") == ""
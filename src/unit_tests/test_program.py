@@ -0,0 +1,23 @@
+import pytest
+from ..program.program import Program
+
+
+@pytest.fixture
+def program():
+    return Program()
+
+
+# ---------------------------
+# Tests for write_joined_to_file
+# ---------------------------
+class TestWriteJoinedToFile:
+    @pytest.mark.parametrize(
+        "parts", [[], ["a"], ["first", "", "third"], ["x", "y", "z"]]
+    )
+    def test_matches_join(self, program, tmp_path, parts):
+        """
+        The streamed file should contain exactly separator.join(parts)
+        """
+        path = tmp_path / "project.act"
+        program.write_joined_to_file(str(path), (p for p in parts), ",\n")
+        assert path.read_text(encoding="utf-8") == ",\n".join(parts)
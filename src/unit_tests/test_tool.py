@@ -0,0 +1,132 @@
+import json
+import pytest
+from unittest.mock import patch
+from ..logger.logger import Logger
+from ..tools.tool import BaseTool
+
+
+@pytest.fixture
+def tool():
+    tool = BaseTool("Test")
+    tool.logger.activate()
+    return tool
+
+
+def _raise_value_error():
+    raise ValueError("broken example")
+
+
+# ---------------------------
+# Tests for _handle_exception
+# ---------------------------
+class TestHandleException:
+    def test_repeated_exception_prints_one_traceback(self, tool, capsys):
+        """
+        The same failure reported twice should print its traceback once
+        """
+        for _ in range(2):
+            try:
+                _raise_value_error()
+            except ValueError as e:
+                tool._handle_exception(e, "failed")
+        assert capsys.readouterr().err.count("Traceback") == 1
+
+    def test_silent_logger_skips_traceback(self, tool, capsys):
+        """
+        No traceback should be printed while the logger is deactivated
+        """
+        tool.logger.deactivate()
+        try:
+            _raise_value_error()
+        except ValueError as e:
+            tool._handle_exception(e, "failed")
+        finally:
+            tool.logger.activate()
+        assert "Traceback" not in capsys.readouterr().err
+
+
+# ---------------------------
+# Tests for tests_start
+# ---------------------------
+class TestTestsStart:
+    def test_workers_report_same_failures(self, tool, tmp_path):
+        """
+        Running examples in worker processes should report the same failures,
+        in the same order, as the serial loop
+        """
+        tool.setType("SV")
+        examples = [
+            {
+                "file": str(tmp_path / f"missing_{i}.sv"),
+                "result_dir": str(tmp_path / f"result_{i}"),
+                "aplan_dir": str(tmp_path / f"aplan_{i}"),
+            }
+            for i in range(3)
+        ]
+        examples_path = tmp_path / "examples.json"
+        examples_path.write_text(json.dumps(examples))
+
+        with patch.object(Logger, "critical") as critical:
+            assert tool.tests_start(str(examples_path)) == 1
+            assert tool.tests_start(str(examples_path), workers=2) == 1
+        serial, parallel = critical.call_args_list
+        assert serial.args[-1] == [(i + 1, e["file"]) for i, e in enumerate(examples)]
+        assert parallel.args == serial.args
+
+
+# ---------------------------
+# Tests for message templates
+# ---------------------------
+class TestMessageTemplates:
+    def test_public_templates_use_str_format(self):
+        """
+        Public MSG_* templates keep their str.format placeholders
+        """
+        assert (
+            BaseTool.MSG_TEST_EXECUTION_TIME.format(test_number=3, time_str="1s")
+            == "Test 3 execution time: 1s"
+        )
+        assert BaseTool.MSG_TOOL_END.format(tool_type="SV", tool_name="T") == (
+            "SV T END"
+        )
+
+    def test_overridden_template_is_logged(self, tool):
+        """
+        A subclass override of a MSG_* template is used for the log record
+        """
+
+        class CustomTool(BaseTool):
+            MSG_SOURCE_FILE = "Reading {file_path} (100%)"
+
+        custom = CustomTool("Custom")
+        with patch.object(Logger, "info") as info:
+            custom._log_template(
+                custom.logger.info, custom.MSG_SOURCE_FILE, file_path="a.sv"
+            )
+        msg, fields = info.call_args.args
+        assert msg % fields == "Reading a.sv (100%)"
+
+    @pytest.mark.parametrize(
+        "template, expected",
+        [
+            ("{tool_name} START", "CUSTOM START"),
+            ("%s START", "CUSTOM START"),
+            ("START", "START"),
+        ],
+    )
+    def test_tool_start_message_accepts_overrides(self, template, expected):
+        """
+        An overridden MSG_TOOL_START does not break construction and is
+        formatted on first use
+        """
+        CustomTool = type("CustomTool", (BaseTool,), {"MSG_TOOL_START": template})
+        assert CustomTool("Custom")._tool_start_message() == expected
+
+    def test_tool_start_message_reports_unknown_field(self):
+        """
+        A MSG_TOOL_START with an unknown field fails with a clear message
+        """
+        CustomTool = type("CustomTool", (BaseTool,), {"MSG_TOOL_START": "{name} START"})
+        tool = CustomTool("Custom")
+        with pytest.raises(ValueError, match="MSG_TOOL_START"):
+            tool._tool_start_message()
@@ -1,4 +1,5 @@
 import pytest
+from ..utils import unsorted
 from ..utils.unsorted import UnsortedUnils
 
 
@@ -7,6 +8,17 @@ def uu():
     return UnsortedUnils()
 
 
+# ---------------------------
+# Tests for the module-level API
+# ---------------------------
+def test_module_functions_match_namespace(uu):
+    """
+    Test that the module-level helpers and the UnsortedUnils namespace agree.
+    """
+    assert unsorted.isNumericString("42") == uu.isNumericString("42") == "42"
+    assert unsorted.containsOperator("a+b") == uu.containsOperator("a+b") == "+"
+
+
 # ---------------------------
 # Tests for is_interval_contained
 # ---------------------------
@@ -44,6 +56,13 @@ def test_isNumericString_invalid(uu):
     assert uu.isNumericString("12a45") is None
 
 
+def test_isNumericString_empty(uu):
+    """
+    Test that an empty string is not treated as a numeric string.
+    """
+    assert uu.isNumericString("") is None
+
+
 # ---------------------------
 # Tests for containsOnlyPipe
 # ---------------------------
@@ -61,6 +80,7 @@ def test_containsOnlyPipe_false(uu):
     String with multiple pipes or other characters should return None.
     """
     assert uu.containsOnlyPipe("||") is None
+    assert uu.containsOnlyPipe("") is None
 
 
 # ---------------------------
@@ -187,6 +207,15 @@ def test_extractDimentionSize_single_value(uu):
     assert uu.extractDimentionSize("[5]") == 5
 
 
+def test_extractDimentionSize_multi_digit_value(uu):
+    """
+    Test that the extractDimentionSize function uses the whole bracketed value.
+    Single value "[16]" → should return 16, not just its first digit.
+    """
+    assert uu.extractDimentionSize("[16]") == 16
+    assert uu.extractDimentionSize("[2*8]") == 16
+
+
 def test_extractDimentionSize_dollar_case(uu):
     """
     Test that the extractDimentionSize function handles the special case of "$".
@@ -204,6 +233,8 @@ def test_extractDimentionSize_dollar_case(uu):
         ("a+b", "+"),
         ("c&d", "&"),
         ("no_ops", None),
+        ("x<=y", "<"),
+        ("", None),
     ],
 )
 def test_containsOperator(uu, s, expected):
@@ -239,3 +270,24 @@ def test_generate_unique_short_id_non_string_raises(uu):
     """
     with pytest.raises(TypeError):
         uu.generate_unique_short_id(123)
+
+
+def test_evaluateExpression_reuses_compiled_code(uu):
+    """
+    Test that repeated expressions are compiled once and leading blanks are
+    accepted like eval() does.
+    """
+    assert uu.evaluateExpression(" 8 - 1") == 7
+    hits = unsorted._compileExpression.cache_info().hits
+    assert uu.evaluateExpression(" 8 - 1") == 7
+    assert unsorted._compileExpression.cache_info().hits == hits + 1
+
+
+def test_evaluateExpression_has_no_builtins(uu):
+    """
+    Test that expressions are evaluated without access to Python builtins.
+    """
+    assert uu.evaluateExpression("(1 if 2 > 1 and not False else 0) + 2**3") == 9
+    assert uu.evaluateExpression("W - 1", {"W": 8}) == 7
+    with pytest.raises(NameError):
+        uu.evaluateExpression("len('abc')")
@@ -147,6 +147,29 @@ def test_incriese_invalid_type(counters):
         counters.incriese(FakeEnum)
 
 
+def test_decriese_invalid_type(counters):
+    """Test that decriese raises ValueError for an unhandled counter type."""
+    with pytest.raises(ValueError, match="Unhandled counter type: NONE_COUNTER"):
+        counters.decriese(CounterTypes.NONE_COUNTER)
+
+
+def test_counter_types_are_ints(counters):
+    """Test that counter types can be passed as their plain int values."""
+    assert CounterTypes.ASSIGNMENT_COUNTER == CounterTypes.ASSIGNMENT_COUNTER.value
+    counters.incriese(CounterTypes.CASE_COUNTER.value)
+    assert counters.get(CounterTypes.CASE_COUNTER) == 1
+
+
+def test_getitem(counters):
+    """Test that indexing returns the counter value and rejects unhandled types."""
+    counters.incriese(CounterTypes.CASE_COUNTER)
+    assert counters[CounterTypes.CASE_COUNTER] == counters.get(
+        CounterTypes.CASE_COUNTER
+    )
+    with pytest.raises(ValueError, match="Unhandled counter type: NONE_COUNTER"):
+        counters[CounterTypes.NONE_COUNTER]
+
+
 def test_deinit_resets_values(counters):
     """
     Test that deinit resets all counters to their initial values.
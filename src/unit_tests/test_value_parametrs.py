@@ -0,0 +1,180 @@
+import pytest
+from ..classes.value_parametrs import (
+    ValueParametr,
+    ValueParametrArray,
+    _prepareExpression,
+)
+
+
+@pytest.fixture
+def parametrs():
+    parametrs = ValueParametrArray()
+    for identifier in ("N", "WIDTH", "AB", "DEPTH", "M"):
+        parametrs.addElement(ValueParametr(identifier, (0, 0), 1))
+    return parametrs
+
+
+# ---------------------------
+# Tests for addElement
+# ---------------------------
+def test_addElement_keeps_length_order(parametrs):
+    """
+    Test that parameters stay sorted by identifier length, longest first,
+    with insertion order kept among identifiers of the same length.
+    """
+    assert [p.identifier for p in parametrs] == ["WIDTH", "DEPTH", "AB", "N", "M"]
+
+
+def test_addElement_returns_index(parametrs):
+    """
+    Test that addElement returns the index of the added parameter.
+    """
+    assert parametrs.addElement(ValueParametr("ABC", (0, 0))) == 2
+    assert parametrs.getElementByIndex(2).identifier == "ABC"
+
+
+# ---------------------------
+# Tests for prepareExpression
+# ---------------------------
+def test_prepareExpression_is_cached():
+    """
+    Test that equal expressions are prepared once and give equal results.
+    """
+    first = ValueParametr("A", (0, 0), expression="WIDTH-1")
+    second = ValueParametr("B", (0, 0), expression="WIDTH-1")
+    first.prepareExpression()
+    hits = _prepareExpression.cache_info().hits
+    second.prepareExpression()
+    assert first.expression == second.expression == "WIDTH - 1"
+    assert _prepareExpression.cache_info().hits == hits + 1
+
+
+# ---------------------------
+# Tests for evaluateParametrExpressionByIndex
+# ---------------------------
+def test_evaluate_uses_current_referenced_values():
+    """
+    Test that cached evaluations are reused only while the referenced
+    parameter values are unchanged.
+    """
+    parametrs = ValueParametrArray()
+    parametrs.addElement(ValueParametr("WIDTH", (0, 0), 8))
+    index = parametrs.addElement(ValueParametr("MSB", (0, 0), expression="WIDTH-1"))
+
+    assert parametrs.evaluateParametrExpressionByIndex(index) == 7
+    assert parametrs.evaluateParametrExpressionByIndex(index) == 7
+
+    parametrs.getElement("WIDTH").value = 16
+    assert parametrs.evaluateParametrExpressionByIndex(index) == 15
+    assert parametrs.getElement("MSB").value == 15
+
+
+# ---------------------------
+# Tests for getElementsIE
+# ---------------------------
+def test_getElementsIE_without_filters_shares_elements(parametrs):
+    """
+    Test that the unfiltered result holds the same parameters in a new list.
+    """
+    result = parametrs.getElementsIE()
+    assert result.elements == parametrs.elements
+    assert result.elements is not parametrs.elements
+    assert result.getElementIndex("AB") == 2
+
+    result.addElement(ValueParametr("EXTRA", (0, 0)))
+    assert len(parametrs) == 5
+
+
+def test_getElementsIE_filters_without_re_preparing():
+    """
+    Test that filtering keeps order and does not prepare expressions twice.
+    """
+    parametrs = ValueParametrArray()
+    parametrs.addElement(ValueParametr("HALF", (0, 0), expression="WIDTH/2"))
+    parametrs.addElement(ValueParametr("N", (0, 0), 4))
+    parametrs.addElement(ValueParametr("LONGEST", (0, 0), 1))
+
+    result = parametrs.getElementsIE(exclude_identifier="N")
+    assert [p.identifier for p in result] == ["LONGEST", "HALF"]
+    assert result.getElement("HALF").expression == "WIDTH // 2"
+
+
+# ---------------------------
+# Tests for extend / +=
+# ---------------------------
+def test_extend_matches_addElement(parametrs):
+    """
+    Test that a batch insert gives the same order as adding one by one.
+    """
+    identifiers = ("XY", "LONGER", "Q", "ABCDEF")
+    one_by_one = parametrs.getElementsIE()
+    for identifier in identifiers:
+        one_by_one.addElement(ValueParametr(identifier, (0, 0)))
+
+    parametrs.extend(ValueParametr(identifier, (0, 0)) for identifier in identifiers)
+    assert [p.identifier for p in parametrs] == [p.identifier for p in one_by_one]
+    assert parametrs.getElementIndex("Q") == len(parametrs) - 1
+
+
+def test_iadd_does_not_prepare_again(parametrs):
+    """
+    Test that += with another ValueParametrArray keeps prepared expressions.
+    """
+    other = ValueParametrArray()
+    other.addElement(ValueParametr("HALF", (0, 0), expression="WIDTH/2"))
+    parametrs += other
+    assert parametrs.getElement("HALF").expression == "WIDTH // 2"
+    assert parametrs.getElementIndex("HALF") == 2
+
+
+def test_extend_rejects_wrong_type(parametrs):
+    """
+    Test that extend type-checks like addElement.
+    """
+    with pytest.raises(TypeError):
+        parametrs.extend([object()])
+
+
+def test_addElement_returns_first_duplicate(parametrs):
+    """
+    Test that adding a duplicate identifier returns the index of the first one.
+    """
+    assert parametrs.addElement(ValueParametr("AB", (0, 0))) == 2
+    assert parametrs.addElement(ValueParametr("Z", (0, 0))) == 6
+    assert [p.identifier for p in parametrs][2:4] == ["AB", "AB"]
+
+
+def test_evaluate_substitutes_only_referenced_parametrs():
+    """
+    Test evaluation with overlapping identifiers and unreferenced parameters.
+    """
+    parametrs = ValueParametrArray()
+    parametrs.addElement(ValueParametr("W", (0, 0), 2))
+    parametrs.addElement(ValueParametr("WIDTH", (0, 0), 8))
+    parametrs.addElement(ValueParametr("UNUSED", (0, 0), 100))
+    index = parametrs.addElement(ValueParametr("D", (0, 0), expression="WIDTH-W"))
+    assert parametrs.evaluateParametrExpressionByIndex(index) == 6
+
+
+# ---------------------------
+# Tests for copy
+# ---------------------------
+def test_copy_keeps_order_and_prepared_expressions():
+    """
+    Test that copy() gives independent parameters with unchanged expressions.
+    """
+    parametrs = ValueParametrArray()
+    parametrs.addElement(ValueParametr("N", (0, 0), 4))
+    parametrs.addElement(ValueParametr("HALF", (0, 0), expression="WIDTH/2"))
+
+    copied = parametrs.copy()
+    assert [p.identifier for p in copied] == ["HALF", "N"]
+    assert copied.getElement("HALF").expression == "WIDTH // 2"
+    assert copied.getElement("N") is not parametrs.getElement("N")
+
+
+def test_value_parametr_uses_slots():
+    """
+    Test that ValueParametr instances have no per-instance __dict__.
+    """
+    assert not hasattr(ValueParametr("A", (0, 0)), "__dict__")
@@ -1,8 +1,10 @@
 from ..singleton.singleton import SingletonMeta
-from enum import Enum, auto
+from enum import IntEnum, auto
+from typing import Dict
 
 
-class CounterTypes(Enum):
+class CounterTypes(IntEnum):
+    # Members are ints, so they index the counters dict directly (no `.value`).
     ASSIGNMENT_COUNTER = auto()
     CASE_COUNTER = auto()
     B_COUNTER = auto()
@@ -25,48 +27,59 @@ class CounterTypes(Enum):
 
 class Counters(metaclass=SingletonMeta):
     types = CounterTypes
-    counters = {}
 
     def __init__(self) -> None:
+        self.counters: Dict[CounterTypes, int] = {}
         self.reinit()
 
     def reinit(self):
-        self.counters[self.types.ASSIGNMENT_COUNTER.value] = 1
-        self.counters[self.types.ASSERT_COUNTER.value] = 1
-        self.counters[self.types.MODULE_COUNTER.value] = 1
-        self.counters[self.types.BODY_COUNTER.value] = 1
-        self.counters[self.types.ELSE_BODY_COUNTER.value] = 1
-        self.counters[self.types.CASE_COUNTER.value] = 0
-        self.counters[self.types.B_COUNTER.value] = 0
-        self.counters[self.types.LOOP_COUNTER.value] = 1
-        self.counters[self.types.CONDITION_COUNTER.value] = 1
-        self.counters[self.types.STRUCT_COUNTER.value] = 0
-        self.counters[self.types.REPEAT_COUNTER.value] = 1
-        self.counters[self.types.FOREVER_COUNTER.value] = 1
-        self.counters[self.types.TASK_COUNTER.value] = 1
-        self.counters[self.types.ENUM_COUNTER.value] = 1
-        self.counters[self.types.OBJECT_COUNTER.value] = 1
-        self.counters[self.types.SEQUENCE_COUNTER.value] = 0
-        self.counters[self.types.DECL_COUNTER.value] = 0
+        self.counters[self.types.ASSIGNMENT_COUNTER] = 1
+        self.counters[self.types.ASSERT_COUNTER] = 1
+        self.counters[self.types.MODULE_COUNTER] = 1
+        self.counters[self.types.BODY_COUNTER] = 1
+        self.counters[self.types.ELSE_BODY_COUNTER] = 1
+        self.counters[self.types.CASE_COUNTER] = 0
+        self.counters[self.types.B_COUNTER] = 0
+        self.counters[self.types.LOOP_COUNTER] = 1
+        self.counters[self.types.CONDITION_COUNTER] = 1
+        self.counters[self.types.STRUCT_COUNTER] = 0
+        self.counters[self.types.REPEAT_COUNTER] = 1
+        self.counters[self.types.FOREVER_COUNTER] = 1
+        self.counters[self.types.TASK_COUNTER] = 1
+        self.counters[self.types.ENUM_COUNTER] = 1
+        self.counters[self.types.OBJECT_COUNTER] = 1
+        self.counters[self.types.SEQUENCE_COUNTER] = 0
+        self.counters[self.types.DECL_COUNTER] = 0
 
     def unhandled_cb(self, counter_type: CounterTypes):
-        raise ValueError(f"Unhandled counter type: {counter_type.name}")
+        name = getattr(counter_type, "name", counter_type)
+        raise ValueError(f"Unhandled counter type: {name}")
 
     def incriese(self, counter_type: CounterTypes):
-        if counter_type.value in self.counters:
-            self.counters[counter_type.value] += 1
-        else:
+        counters = self.counters
+        try:
+            counters[counter_type] += 1
+        except KeyError:
             self.unhandled_cb(counter_type)
 
     def decriese(self, counter_type: CounterTypes):
-        if counter_type.value in self.counters:
-            if self.counters[counter_type.value] > 0:
-                self.counters[counter_type.value] -= 1
-        else:
+        counters = self.counters
+        try:
+            value = counters[counter_type]
+        except KeyError:
+            self.unhandled_cb(counter_type)
+        if value > 0:
+            counters[counter_type] = value - 1
+
+    def __getitem__(self, counter_type: CounterTypes) -> int:
+        """Same as `get`: ``counters[CounterTypes.X]``."""
+        try:
+            return self.counters[counter_type]
+        except KeyError:
             self.unhandled_cb(counter_type)
 
     def get(self, counter_type: CounterTypes):
-        value = self.counters.get(counter_type.value, None)
+        value = self.counters.get(counter_type)
         if value is None:
             self.unhandled_cb(counter_type)
         return value
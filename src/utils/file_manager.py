@@ -1,17 +1,33 @@
+import copy
 import difflib
+import filecmp
+import functools
 import json
 import shutil
 import os
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from ..logger.logger import Logger, LoggerManager
 from ..singleton.singleton import SingletonMeta
 
-import glob
-
 ExampleEntry = Dict[str, str]
 
 
+@functools.lru_cache(maxsize=32)
+def _load_examples_cached(
+    filepath: str, mtime_ns: int, size: int
+) -> Tuple[ExampleEntry, ...]:
+    # `mtime_ns` and `size` are part of the key only, so a rewritten file is
+    # parsed again instead of being served from the cache.
+    with open(filepath, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    if not isinstance(data, list):
+        raise TypeError("JSON file should contain a list of example objects.")
+
+    return tuple(data)
+
+
 class FilesMngr(metaclass=SingletonMeta):
     def __init__(self):
         self.logger: Logger = LoggerManager().getLogger(self.__class__.__qualname__)
@@ -46,32 +62,53 @@ class FilesMngr(metaclass=SingletonMeta):
 
         return differences
 
+    @staticmethod
+    def _list_file_names(path: str) -> List[str]:
+        """Names of the non-hidden files in `path` ([] if it is missing)."""
+        try:
+            with os.scandir(path) as entries:
+                # DirEntry.is_file() uses the type returned by the directory
+                # listing, so this costs no extra stat call per entry.
+                return [
+                    entry.name
+                    for entry in entries
+                    if entry.name[0] != "." and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
     def compareAplanByPathes(
         self, path1, path2, extensions_to_compare: str | None = None
     ):
         result = False
         if extensions_to_compare == None:
             extensions_to_compare = [".act", ".behp", ".env_descript", ".evt_descript"]
+        names1 = self._list_file_names(path1)
+        names2 = set(self._list_file_names(path2))
         for ext in extensions_to_compare:
-            files1 = glob.glob(os.path.join(path1, "*" + ext))
-            files2 = glob.glob(os.path.join(path2, "*" + ext))
-
-            for file1 in files1:
-                filename = os.path.basename(file1)
-                file2 = os.path.join(path2, filename)
-                if file2 in files2:
-                    differences = self.compare(file1, file2)
+            for filename in names1:
+                if not filename.endswith(ext):
+                    continue
+                if filename in names2:
+                    file1 = os.path.join(path1, filename)
+                    file2 = os.path.join(path2, filename)
+                    # Byte-identical files need no diff; otherwise the text
+                    # diff decides (e.g. files differing only in line endings).
+                    if filecmp.cmp(file1, file2, shallow=False):
+                        differences = None
+                    else:
+                        differences = self.compare(file1, file2)
                     if differences:
-                        self.logger.error(f"File {filename} differences:")
+                        self.logger.error("File %s differences:", filename)
                         for diff in differences:
-                            self.logger.error(f"{diff}")
+                            self.logger.error("%s", diff)
                         result = True
                     else:
                         self.logger.info(
-                            f"Files {filename} are the same ", color="blue"
+                            "Files %s are the same ", filename, color="blue"
                         )
                 else:
-                    self.logger.error(f"File {filename} not found in {path2}")
+                    self.logger.error("File %s not found in %s", filename, path2)
 
         return result
 
@@ -82,22 +119,22 @@ class FilesMngr(metaclass=SingletonMeta):
                 f"Directory {directory_path} has been removed.\n", color="bold_yellow"
             )
         else:
-            self.logger.warning(f"Directory {directory_path} does not exist.\n")
+            self.logger.warning("Directory %s does not exist.\n", directory_path)
 
     def load_examples_from_json(self, filepath: str) -> List[ExampleEntry]:
-        if not os.path.exists(filepath):
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
             self.logger.warning(
-                f"JSON file not found at '{filepath}'. Returning empty list."
+                "JSON file not found at '%s'. Returning empty list.", filepath
             )
             return []
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        if not isinstance(data, list):
-            raise TypeError("JSON file should contain a list of example objects.")
-
-        return data
+        # The cached entries are shared between calls; hand out copies so a
+        # caller that edits an example cannot change later loads of the file.
+        return copy.deepcopy(
+            list(_load_examples_cached(filepath, stat.st_mtime_ns, stat.st_size))
+        )
 
     def replace_filename(self, path: str, new_filename: str) -> str:
         """The function `replace_filename` takes a file path and a new filename, and returns a new path with
@@ -1,22 +1,36 @@
+import functools
 import time
-from ..singleton.singleton import SingletonMeta
 
 
-class TimeUtils(metaclass=SingletonMeta):
-    def __init__(self):
-        pass
+@functools.lru_cache(maxsize=1024)
+def _format_date_h_m_s(seconds: int) -> str:
+    # time.localtime truncates to whole seconds, so caching on the int value
+    # returns exactly what an uncached call would.
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
 
-    def format_time_m_s(self, input_time):
-        minutes = input_time // 60
-        input_time %= 60
 
-        if minutes > 0:
-            return f"{int(minutes)} m {int(input_time)} s"
-        else:
-            return f"{int(input_time)} s"
+def format_time_m_s(input_time):
+    minutes, seconds = divmod(int(input_time), 60)
 
-    def format_time_date_h_m_s(self, input_time):
-        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(input_time))
+    if minutes > 0:
+        return f"{minutes} m {seconds} s"
+    else:
+        return f"{seconds} s"
 
-    def format_time_h_m_s(self, input_time):
-        return time.strftime("%H:%M:%S", time.localtime(input_time))
+
+def format_time_date_h_m_s(input_time):
+    return _format_date_h_m_s(int(input_time))
+
+
+def format_time_h_m_s(input_time):
+    return time.strftime("%H:%M:%S", time.localtime(input_time))
+
+
+class TimeUtils:
+    """
+    Backwards-compatible namespace for the time formatting functions above.
+    """
+
+    format_time_m_s = staticmethod(format_time_m_s)
+    format_time_date_h_m_s = staticmethod(format_time_date_h_m_s)
+    format_time_h_m_s = staticmethod(format_time_h_m_s)